@@ -1,24 +1,519 @@
 #!/usr/bin/env python3
 
-from typing import Any
+import atexit
+import codecs
+import operator
+import random
+import sys
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple,
+    Union
+)
 from abc import ABC, abstractmethod
 
+_INT_FORMATS = frozenset("bBhHiIlLqQnN")
+
+
+def _numpy() -> Any:
+    """
+    Import NumPy lazily so it stays an optional dependency.
+
+    :return: The numpy module, or None if it is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class RunningStats:
+    """
+    Mergeable summary statistics over a stream of numeric batches.
+
+    Keeps count, sum, min, max, mean and the sum of squared deviations
+    (Welford) so that variance is available without revisiting earlier
+    batches. Batches are folded in with the parallel merge formula, which
+    also lets accumulators from different workers be combined. An
+    optional reservoir sample gives approximate quantiles; it is drawn
+    from the accumulator's own random generator, so successive batches
+    sample different positions.
+    """
+
+    def __init__(
+            self, sample_size: int = 0, seed: Optional[int] = None) -> None:
+        """
+        Initialize an empty accumulator.
+
+        :param sample_size: Reservoir size for approximate quantiles, 0
+            disables quantile tracking.
+        :param seed: Seed of the sampling generator, for reproducible
+            quantiles.
+        """
+        self.count = 0
+        self.total: Union[int, float] = 0
+        self.minimum: Optional[Union[int, float]] = None
+        self.maximum: Optional[Union[int, float]] = None
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sample_size = sample_size
+        self.sample: List[Union[int, float]] = []
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def from_values(
+            cls, values: Any, sample_size: int = 0,
+            rng: Optional[random.Random] = None) -> "RunningStats":
+        """
+        Build an accumulator from a single batch.
+
+        Every statistic is computed by a C-level pass (sum, sum of
+        squares, min, max), the variance coming from the sum of squares.
+        The sample is taken by drawing indices, values are never copied.
+        NumPy sums in 64 bits, so integer batches whose sum could overflow
+        are summed exactly in Python instead, as lists are.
+
+        :param values: Sequence or buffer of numbers.
+        :param sample_size: Reservoir size for approximate quantiles.
+        :param rng: Generator used for sampling, shared by the returned
+            accumulator. A new unseeded one by default.
+        :return: Accumulator describing the batch.
+        """
+        stats = cls(sample_size)
+        if rng is not None:
+            stats._rng = rng
+        count = len(values)
+        if not count:
+            return stats
+        np = _numpy()
+        if np is not None and not isinstance(values, list):
+            array = np.asarray(values)
+            sample = array.__getitem__
+            minimum, maximum = array.min().item(), array.max().item()
+            if (array.dtype.kind in "iu" and
+                    max(-minimum, maximum) * count >= 1 << 63):
+                total = sum(map(int, values))
+            else:
+                total = array.sum().item()
+            if array.dtype.kind == "f" or (
+                    max(-minimum, maximum) ** 2 * count < 1 << 63):
+                squares = np.dot(array, array).item()
+            else:
+                squares = sum(map(operator.mul, map(int, values),
+                                  map(int, values)))
+        else:
+            sample = values.__getitem__
+            total = sum(values)
+            squares = sum(map(operator.mul, values, values))
+            minimum, maximum = min(values), max(values)
+        mean = total / count
+        m2 = max((squares * count - total * total) / count, 0.0)
+        stats.count = count
+        stats.total = total
+        stats.mean = mean
+        stats.m2 = m2
+        stats.minimum = minimum
+        stats.maximum = maximum
+        if sample_size:
+            if count <= sample_size:
+                indexes: Iterable[int] = range(count)
+            else:
+                indexes = stats._rng.sample(range(count), sample_size)
+            stats.sample = [sample(index) for index in indexes]
+            if np is not None and not isinstance(values, list):
+                stats.sample = [value.item() for value in stats.sample]
+        return stats
+
+    def update(self, values: Any) -> "RunningStats":
+        """
+        Fold a new batch into the accumulator.
+
+        :param values: Sequence or buffer of numbers.
+        :return: Accumulator describing the batch alone.
+        """
+        batch = RunningStats.from_values(
+            values, self.sample_size, self._rng)
+        self.merge(batch)
+        return batch
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Combine another accumulator into this one.
+
+        :param other: Accumulator built from disjoint data.
+        """
+        if not other.count:
+            return
+        if not self.count:
+            merged_sample = other.sample[:self.sample_size]
+        else:
+            merged_sample = self._merge_sample(other)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.total += other.total
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        self.count = count
+        self.sample = merged_sample
+
+    def _merge_sample(self, other: "RunningStats") -> List[Any]:
+        """
+        Merge two reservoirs, weighting each by the count it represents.
+
+        :param other: Accumulator whose sample is merged.
+        :return: Combined sample of at most sample_size values.
+        """
+        if not self.sample_size:
+            return []
+        count = self.count + other.count
+        mine = round(self.sample_size * self.count / count)
+        mine = min(mine, len(self.sample))
+        theirs = min(self.sample_size - mine, len(other.sample))
+        return (self._rng.sample(self.sample, mine) +
+                self._rng.sample(other.sample, theirs))
+
+    @property
+    def variance(self) -> float:
+        """
+        Population variance of all values seen.
+
+        :return: Variance, 0.0 when empty.
+        """
+        return self.m2 / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate the q-quantile from the reservoir sample.
+
+        :param q: Quantile in [0, 1].
+        :return: Estimated quantile, None if no sample is kept.
+        """
+        if not self.sample:
+            return None
+        ordered = sorted(self.sample)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class OutputSink(ABC):
+    """
+    Destination for processor messages.
+
+    A record is written as several parts that are only converted to
+    strings by sinks that actually emit them.
+    """
+
+    @abstractmethod
+    def write(self, *parts: Any) -> None:
+        """
+        Write one record.
+
+        :param parts: Pieces of the record, concatenated on output.
+        """
+        pass
+
+    def flush(self) -> None:
+        """
+        Emit any buffered records.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Emit any buffered records and release the sink.
+        """
+        self.flush()
+
+    def __enter__(self) -> "OutputSink":
+        """
+        Use the sink as a context manager.
+
+        :return: The sink itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Close the sink when leaving the context.
+
+        :param exc_info: Exception raised in the context, if any.
+        """
+        self.close()
+
+
+class PrintSink(OutputSink):
+    """
+    Sink printing every record immediately, the historical behavior.
+    """
+
+    def write(self, *parts: Any) -> None:
+        """
+        Print one record to stdout.
+
+        :param parts: Pieces of the record, concatenated on output.
+        """
+        print(*parts, sep="")
+
+
+class NullSink(OutputSink):
+    """
+    Sink discarding every record without formatting it.
+    """
+
+    def write(self, *parts: Any) -> None:
+        """
+        Discard one record.
+
+        :param parts: Pieces of the record, ignored.
+        """
+        pass
+
+
+class RingBufferSink(OutputSink):
+    """
+    Sink keeping the most recent records in memory.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Initialize the ring buffer.
+
+        :param capacity: Maximum number of records retained.
+        """
+        self._records: Deque[Tuple[Any, ...]] = deque(maxlen=capacity)
+
+    def write(self, *parts: Any) -> None:
+        """
+        Store one record, evicting the oldest when full.
+
+        :param parts: Pieces of the record, stored unformatted.
+        """
+        self._records.append(parts)
+
+    def records(self) -> List[str]:
+        """
+        Return the retained records, oldest first.
+
+        :return: Formatted records.
+        """
+        return ["".join(map(str, parts)) for parts in self._records]
+
+
+_live_sinks: "weakref.WeakSet[BatchedSink]" = weakref.WeakSet()
+_pending_sinks: "set[BatchedSink]" = set()
+_flush_condition = threading.Condition()
+_flush_thread: Optional[threading.Thread] = None
+
+
+def _schedule_flush(sink: "BatchedSink") -> None:
+    """
+    Ask the shared flusher thread to flush a sink at its deadline.
+
+    :param sink: Sink whose first buffered record just arrived.
+    """
+    global _flush_thread
+    with _flush_condition:
+        _pending_sinks.add(sink)
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(
+                target=_flush_due_sinks, daemon=True)
+            _flush_thread.start()
+        _flush_condition.notify()
+
+
+def _flush_due_sinks() -> None:
+    """
+    Flush pending sinks once their deadline passed, forever.
+
+    A sink is only referenced while it has records waiting, so a sink
+    that is no longer used can be collected after its last flush.
+    """
+    while True:
+        with _flush_condition:
+            now = time.monotonic()
+            due = [sink for sink in _pending_sinks if sink._deadline <= now]
+            if not due:
+                deadlines = [sink._deadline for sink in _pending_sinks]
+                _flush_condition.wait(
+                    min(deadlines) - now if deadlines else None)
+                continue
+            for sink in due:
+                _pending_sinks.discard(sink)
+        for sink in due:
+            sink.flush()
+        due = sink = None
+
+
+@atexit.register
+def _close_sinks() -> None:
+    """
+    Flush and close every live BatchedSink at interpreter exit.
+    """
+    for sink in list(_live_sinks):
+        sink.close()
+
+
+class BatchedSink(OutputSink):
+    """
+    Sink buffering records and writing them to a stream in batches.
+
+    The buffer is flushed once it holds max_records records, and a
+    background thread shared by every sink flushes it max_ms milliseconds
+    after the first buffered record, so output is not held back when
+    writes stop. Remaining records are flushed by close, when leaving a
+    with block or at interpreter exit. The flusher only holds a sink
+    while it has records waiting and the exit hook holds it weakly, so
+    unused sinks are collected.
+
+    The sink can be pickled, e.g. to send a processor to a worker
+    process, when it writes to sys.stdout or sys.stderr; the unpickled
+    copy writes to the standard stream of its own process.
+    """
+
+    _STANDARD_STREAMS = ("stdout", "stderr")
+
+    def __init__(
+            self, stream: Optional[TextIO] = None,
+            max_records: int = 1000, max_ms: float = 100.0) -> None:
+        """
+        Initialize the batched writer.
+
+        :param stream: Text stream to write to, defaults to stdout.
+        :param max_records: Record count triggering a flush.
+        :param max_ms: Delay in milliseconds triggering a flush.
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.max_records = max_records
+        self.max_ms = max_ms
+        self._setup()
+
+    def _setup(self) -> None:
+        """
+        Create the buffer, lock and flusher state.
+        """
+        self._buffer: List[str] = []
+        self._count = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._deadline = 0.0
+        _live_sinks.add(self)
+
+    def write(self, *parts: Any) -> None:
+        """
+        Buffer one record, flushing if the record count is reached.
+
+        :param parts: Pieces of the record, concatenated on output.
+        :raises ValueError: If the sink is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError("write to a closed BatchedSink")
+            self._buffer.extend(map(str, parts))
+            self._buffer.append("\n")
+            self._count += 1
+            if self._count >= self.max_records:
+                self._flush_locked()
+            elif self._count == 1:
+                self._deadline = time.monotonic() + self.max_ms / 1000
+                _schedule_flush(self)
+
+    def flush(self) -> None:
+        """
+        Write the buffered records to the stream.
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """
+        Write the buffered records, the lock being held by the caller.
+        """
+        if self._buffer:
+            self.stream.writelines(self._buffer)
+            self.stream.flush()
+            self._buffer.clear()
+        self._count = 0
+
+    def close(self) -> None:
+        """
+        Flush the remaining records and stop accepting new ones.
+
+        The stream itself is left open. Closing twice has no effect.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+        _live_sinks.discard(self)
+        with _flush_condition:
+            _pending_sinks.discard(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Describe the sink for pickling.
+
+        Buffered records are flushed first, and the stream is replaced by
+        the name of the standard stream it is.
+
+        :return: Picklable state.
+        :raises TypeError: If the sink writes to another stream.
+        """
+        self.flush()
+        for name in self._STANDARD_STREAMS:
+            if self.stream is getattr(sys, name):
+                return {"stream": name, "max_records": self.max_records,
+                        "max_ms": self.max_ms}
+        raise TypeError(
+            "cannot pickle a BatchedSink writing to "
+            f"{self.stream!r}, only sys.stdout and sys.stderr are supported")
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Rebuild an empty sink writing to this process's standard stream.
+
+        :param state: State returned by __getstate__.
+        """
+        self.stream = getattr(sys, state["stream"])
+        self.max_records = state["max_records"]
+        self.max_ms = state["max_ms"]
+        self._setup()
+
 
 class DataProcessor(ABC):
     """
     Abstract base class defining a common interface for all data processors.
 
     Subclasses must implement data validation and processing logic while
-    sharing a consistent interface for polymorphic behavior.
+    sharing a consistent interface for polymorphic behavior. ACCEPTS
+    lists the input types validate can ever accept, used by
+    ProcessorPool to skip processors by type.
     """
 
-    def __init__(self, silent: bool = False) -> None:
+    ACCEPTS: Tuple[type, ...] = (object,)
+
+    def __init__(
+            self, silent: bool = False,
+            sink: Optional[OutputSink] = None) -> None:
         """
         Initialize the data processor.
 
         :param silent: If True, suppress processing output messages.
+        :param sink: Destination for processor messages, defaults to
+            printing them (or discarding them when silent).
         """
         self.silent = silent
+        if sink is None:
+            sink = NullSink() if silent else PrintSink()
+        self.sink = sink
 
     def print_processing(self, data: Any) -> None:
         """
@@ -26,8 +521,7 @@ class DataProcessor(ABC):
 
         :param data: The data being processed.
         """
-        if not self.silent:
-            print(f"Processing data: {data}")
+        self.sink.write("Processing data: ", data)
 
     @abstractmethod
     def process(self, data: Any) -> str:
@@ -58,23 +552,50 @@ class DataProcessor(ABC):
         """
         return f"Output: {result}"
 
+    def write_output(self, result: str) -> None:
+        """
+        Write the formatted result to the sink.
+
+        Same layout as format_output, passed as parts so that no string
+        is built unless the sink emits it.
+
+        :param result: Raw processing result string.
+        """
+        self.sink.write("Output: ", result)
+
 
 class NumericProcessor(DataProcessor):
     """
     Processor for numeric data collections.
 
-    Handles lists of integers and computes summary statistics.
+    Handles lists of integers and computes summary statistics. When
+    enabled, statistics are also accumulated across calls in stats;
+    otherwise only the sum is computed. Large integer buffers
+    (array.array, memoryview, NumPy arrays) can be handed to
+    process_batch to be validated and summed in a single pass.
     """
 
-    def __init__(self, silent: bool = False) -> None:
+    BATCH_THRESHOLD = 4096
+
+    def __init__(
+            self, silent: bool = False,
+            sink: Optional[OutputSink] = None,
+            track_stats: bool = False, sample_size: int = 0) -> None:
         """
         Initialize the numeric processor.
 
         :param silent: If True, suppress processing output messages.
+        :param sink: Destination for processor messages.
+        :param track_stats: Accumulate statistics across calls in stats,
+            at the cost of extra passes over every batch.
+        :param sample_size: Reservoir size used by stats for approximate
+            quantiles, 0 disables them. A positive value enables stats.
         """
-        super().__init__(silent)
-        if not silent:
-            print("Initializing Numeric Processor...")
+        super().__init__(silent, sink)
+        self.stats: Optional[RunningStats] = None
+        if track_stats or sample_size:
+            self.stats = RunningStats(sample_size)
+        self.sink.write("Initializing Numeric Processor...")
 
     def process(self, data: Any) -> str:
         """
@@ -86,24 +607,91 @@ class NumericProcessor(DataProcessor):
         """
         try:
             self.print_processing(data)
-            s = sum(data)
-            list_size = len(data)
-            return (
-                f"Processed {list_size} numeric values, "
-                f"sum={s}, avg={int(100 * s / list_size) / 100}"
-            )
+            if self.stats is None:
+                return self._summary(len(data), sum(data))
+            batch = self.stats.update(data)
+            return self._summary(batch.count, batch.total)
         except Exception:
             raise Exception("Data is not an array of int")
 
+    def process_batch(self, data: Any) -> str:
+        """
+        Process a large integer buffer without copying it.
+
+        The buffer format is checked once instead of inspecting every
+        element, and statistics are computed by NumPy when installed.
+        Lists and buffers smaller than BATCH_THRESHOLD go through the
+        regular process path.
+
+        :param data: List of integers or integer buffer to process.
+        :return: Summary string of numeric processing.
+        :raises Exception: If data is invalid.
+        """
+        view = self._int_buffer(data)
+        if view is None or len(view) < self.BATCH_THRESHOLD:
+            if not self.validate(data):
+                raise Exception("Data is not an array of int")
+            return self.process(data if view is None else view.tolist())
+        self.sink.write("Processing data: <", len(view),
+                        " values, format '", view.format, "'>")
+        if self.stats is None:
+            return self._summary(len(view), sum(view))
+        batch = self.stats.update(view)
+        return self._summary(batch.count, batch.total)
+
+    @staticmethod
+    def _summary(count: int, total: int) -> str:
+        """
+        Build the summary line shared by the list and buffer paths.
+
+        :param count: Number of values processed.
+        :param total: Sum of the values.
+        :return: Summary string of numeric processing.
+        """
+        return (
+            f"Processed {count} numeric values, "
+            f"sum={total}, avg={int(100 * total / count) / 100}"
+        )
+
+    @staticmethod
+    def _int_buffer(data: Any) -> Optional[memoryview]:
+        """
+        Expose data as a flat integer memoryview without copying.
+
+        bytes and bytearray are byte strings rather than integer
+        collections, so they are rejected even though their buffer
+        format is 'B'.
+
+        :param data: Object that may support the buffer protocol.
+        :return: One-dimensional memoryview, or None if data is not a
+            contiguous native integer buffer.
+        """
+        if isinstance(data, (bytes, bytearray)):
+            return None
+        try:
+            view = memoryview(data)
+        except TypeError:
+            return None
+        if view.format not in _INT_FORMATS:
+            return None
+        if view.ndim != 1:
+            if not view.c_contiguous:
+                return None
+            view = view.cast("B").cast(view.format)
+        return view
+
     def validate(self, data: Any) -> bool:
         """
         Validate that the data is a list of integers.
 
+        Integer buffers are accepted as well, their format already
+        guarantees every element is an integer.
+
         :param data: Data to validate.
         :return: True if valid numeric list, False otherwise.
         """
         if type(data) is not list:
-            return False
+            return self._int_buffer(data) is not None
         for elem in data:
             if type(elem) is not int:
                 return False
@@ -117,15 +705,20 @@ class TextProcessor(DataProcessor):
     Computes character and word counts for strings.
     """
 
-    def __init__(self, silent: bool = False) -> None:
+    ACCEPTS = (str,)
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(
+            self, silent: bool = False,
+            sink: Optional[OutputSink] = None) -> None:
         """
         Initialize the text processor.
 
         :param silent: If True, suppress processing output messages.
+        :param sink: Destination for processor messages.
         """
-        super().__init__(silent)
-        if not silent:
-            print("Initializing Text Processor...")
+        super().__init__(silent, sink)
+        self.sink.write("Initializing Text Processor...")
 
     def process(self, data: Any) -> str:
         """
@@ -134,13 +727,63 @@ class TextProcessor(DataProcessor):
         :param data: String to process.
         :return: Summary string of text processing.
         """
-        self.print_processing(f"\"{data}\"")
+        self.sink.write('Processing data: "', data, '"')
+        return self._summary(len(data), data.count(" ") + 1)
+
+    def process_stream(self, source: Any, encoding: str = "utf-8") -> str:
+        """
+        Process text arriving in chunks without materializing it.
+
+        Counts are kept across chunk boundaries, so the result matches
+        process on the concatenated text. Binary chunks are decoded
+        incrementally, so characters split between chunks are counted
+        once.
+
+        :param source: Iterable of str or bytes-like chunks, or a text or
+            binary file object.
+        :param encoding: Encoding of binary chunks.
+        :return: Summary string of text processing.
+        """
+        if hasattr(source, "read"):
+            chunks = self._read_chunks(source)
+        else:
+            chunks = iter(source)
+        self.print_processing("<stream>")
+        decoder = codecs.getincrementaldecoder(encoding)()
         characters = 0
-        words = 1
-        for char in data:
-            characters += 1
-            if char == ' ':
-                words += 1
+        spaces = 0
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+            characters += len(chunk)
+            spaces += chunk.count(" ")
+        tail = decoder.decode(b"", final=True)
+        characters += len(tail)
+        spaces += tail.count(" ")
+        return self._summary(characters, spaces + 1)
+
+    def _read_chunks(self, stream: Any) -> Iterator[Any]:
+        """
+        Read a file object in CHUNK_SIZE pieces until exhausted.
+
+        :param stream: Text or binary file object.
+        :return: Iterator over the chunks read.
+        """
+        while True:
+            chunk = stream.read(self.CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _summary(characters: int, words: int) -> str:
+        """
+        Build the summary line shared by the string and stream paths.
+
+        :param characters: Number of characters seen.
+        :param words: Number of words seen.
+        :return: Summary string of text processing.
+        """
         return (
             f"Processed text: {characters} characters, {words} words"
         )
@@ -159,18 +802,32 @@ class LogProcessor(DataProcessor):
     """
     Processor for log entries.
 
-    Detects log level and formats log messages accordingly.
+    Detects log level and formats log messages accordingly. The level is
+    read once from the "LEVEL:" prefix of each line and dispatched through
+    the LEVELS table, and a per-level histogram is kept across calls.
     """
 
-    def __init__(self, silent: bool = False):
+    ACCEPTS = (str,)
+    LEVELS = {
+        "DEBUG": "DEBUG",
+        "INFO": "INFO",
+        "WARN": "WARNING",
+        "ERROR": "ALERT",
+        "CRITICAL": "ALERT",
+    }
+
+    def __init__(
+            self, silent: bool = False,
+            sink: Optional[OutputSink] = None) -> None:
         """
         Initialize the log processor.
 
         :param silent: If True, suppress processing output messages.
+        :param sink: Destination for processor messages.
         """
-        super().__init__(silent)
-        if not silent:
-            print("Initializing Log Processor...")
+        super().__init__(silent, sink)
+        self.histogram: Counter[str] = Counter()
+        self.sink.write("Initializing Log Processor...")
 
     def process(self, data: Any) -> str:
         """
@@ -179,14 +836,38 @@ class LogProcessor(DataProcessor):
         :param data: Log message string.
         :return: Processed log message.
         """
-        self.print_processing(f"\"{data}\"")
+        self.sink.write('Processing data: "', data, '"')
         if type(data) is str:
-            return (
-                data.replace("ERROR:", "ERROR level detected:")
-                    .replace("INFO:", "INFO level detected:")
-            )
+            level, sep, message = data.partition(":")
+            if sep and level in self.LEVELS:
+                self.histogram[level] += 1
+                return f"{level} level detected:{message}"
+            return data
         return f"Invalid log: {data}"
 
+    def process_lines(self, lines: Iterable[str]) -> List[str]:
+        """
+        Process a batch of log lines in a single call.
+
+        Lines without a known level prefix are returned unchanged.
+
+        :param lines: Log message strings.
+        :return: Processed log messages, in input order.
+        """
+        levels = self.LEVELS
+        seen: List[str] = []
+        results: List[str] = []
+        for line in lines:
+            level, sep, message = line.partition(":")
+            if sep and level in levels:
+                seen.append(level)
+                results.append(f"{level} level detected:{message}")
+            else:
+                results.append(line)
+        self.histogram.update(seen)
+        self.sink.write("Processing data: <", len(results), " log lines>")
+        return results
+
     def validate(self, data: Any) -> bool:
         """
         Validate that the data is a supported log entry.
@@ -194,10 +875,10 @@ class LogProcessor(DataProcessor):
         :param data: Data to validate.
         :return: True if valid log entry, False otherwise.
         """
-        return (
-            type(data) is str and
-            ("ERROR:" in data or "INFO:" in data)
-        )
+        if type(data) is not str:
+            return False
+        level, sep, _ = data.partition(":")
+        return bool(sep) and level in self.LEVELS
 
     def format_output(self, result: str) -> str:
         """
@@ -206,11 +887,128 @@ class LogProcessor(DataProcessor):
         :param result: Processed log message.
         :return: Formatted log output string.
         """
-        log_type = "INFO"
-        if "ERROR" in result:
-            log_type = "ALERT"
+        log_type = self.LEVELS.get(result.partition(" ")[0], "INFO")
         return f"Output: [{log_type}] {result}"
 
+    def write_output(self, result: str) -> None:
+        """
+        Write the formatted log output to the sink.
+
+        :param result: Processed log message.
+        """
+        log_type = self.LEVELS.get(result.partition(" ")[0], "INFO")
+        self.sink.write("Output: [", log_type, "] ", result)
+
+
+def _run_batch(processor: DataProcessor, items: List[Any]) -> List[str]:
+    """
+    Process a batch of items with one processor.
+
+    Defined at module level so it can be shipped to worker processes.
+
+    The processor's sink is flushed before returning, as a worker
+    process may exit before a buffering sink flushes on its own.
+
+    :param processor: Processor handling every item of the batch.
+    :param items: Items already validated by the processor.
+    :return: Formatted outputs, in batch order.
+    """
+    try:
+        return [processor.format_output(processor.process(item))
+                for item in items]
+    finally:
+        processor.sink.flush()
+
+
+class ProcessorPool:
+    """
+    Dispatcher routing heterogeneous items to matching processors.
+
+    Each item goes to the first processor whose validate accepts it, so
+    more specific processors should be listed first. The processors whose
+    ACCEPTS covers an input type are cached per type, in priority order,
+    so items only try processors that can accept their type. Per-processor
+    batches run on a process pool and results are returned in input
+    order.
+    """
+
+    def __init__(
+            self, processors: List[DataProcessor],
+            max_workers: Optional[int] = None,
+            batch_size: int = 1024) -> None:
+        """
+        Initialize the pool.
+
+        :param processors: Candidate processors, in priority order. They
+            run in worker processes, so they should be silent and any
+            state they update there is not reflected in the parent.
+        :param max_workers: Worker process count, defaults to CPU count.
+            A value of 1 processes everything in the current process.
+        :param batch_size: Maximum number of items sent per task.
+        """
+        self.processors = processors
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._routes: Dict[type, List[DataProcessor]] = {}
+
+    def route(self, item: Any) -> Optional[DataProcessor]:
+        """
+        Find the processor responsible for an item.
+
+        :param item: Item to route.
+        :return: Matching processor, or None if none accepts the item.
+        """
+        kind = type(item)
+        candidates = self._routes.get(kind)
+        if candidates is None:
+            candidates = self._routes[kind] = [
+                p for p in self.processors if issubclass(kind, p.ACCEPTS)]
+        for processor in candidates:
+            if processor.validate(item):
+                return processor
+        return None
+
+    def run(self, items: Iterable[Any]) -> List[Optional[str]]:
+        """
+        Route and process a stream of items.
+
+        :param items: Heterogeneous input items.
+        :return: Formatted outputs in input order, None for items that no
+            processor accepts.
+        """
+        results: List[Optional[str]] = []
+        batches: Dict[int, Tuple[DataProcessor, List[int], List[Any]]] = {}
+        for index, item in enumerate(items):
+            results.append(None)
+            processor = self.route(item)
+            if processor is None:
+                continue
+            _, indexes, batch = batches.setdefault(
+                id(processor), (processor, [], []))
+            indexes.append(index)
+            batch.append(item)
+
+        tasks = []
+        for processor, indexes, batch in batches.values():
+            for start in range(0, len(batch), self.batch_size):
+                end = start + self.batch_size
+                tasks.append(
+                    (processor, indexes[start:end], batch[start:end]))
+
+        if self.max_workers == 1 or len(tasks) <= 1:
+            outputs = [_run_batch(p, chunk) for p, _, chunk in tasks]
+        else:
+            with ProcessPoolExecutor(self.max_workers) as executor:
+                outputs = list(executor.map(
+                    _run_batch,
+                    [p for p, _, _ in tasks],
+                    [chunk for _, _, chunk in tasks]))
+
+        for (_, indexes, _), output in zip(tasks, outputs):
+            for index, result in zip(indexes, output):
+                results[index] = result
+        return results
+
 
 def main():
     """
@@ -1,7 +1,512 @@
 #!/usr/bin/env python3
 
+import ast
+import asyncio
+import operator
+import struct
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import (
+    Any, AsyncIterable, Callable, Deque, Iterable, Iterator, List, Dict,
+    Tuple, Union, Optional
+)
+
+
+def _parse_value(value: str) -> Any:
+    """Convert a raw value to int or float when it is numeric.
+
+    Args:
+        value (str): Raw value.
+
+    Returns:
+        Any: Parsed number, or the stripped string.
+    """
+    value = value.strip()
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class StreamWindow:
+    """Incremental aggregate over a tumbling or sliding window.
+
+    Windows are measured either in events ("count") or in seconds
+    ("time"). Sum and count are updated in O(1) per event; a sliding
+    window evicts expired events from the left of a deque, a tumbling
+    window publishes its aggregate in last_closed and restarts empty.
+    """
+
+    def __init__(self, size: float, kind: str = "sliding",
+                 by: str = "count") -> None:
+        """Initialize an empty window.
+
+        Args:
+            size (float): Window length, in events or in seconds.
+            kind (str): "sliding" or "tumbling".
+            by (str): "count" or "time".
+
+        Raises:
+            ValueError: If kind, by or size is not supported.
+        """
+        if kind not in ("sliding", "tumbling"):
+            raise ValueError(f"Unknown window kind: {kind}")
+        if by not in ("count", "time"):
+            raise ValueError(f"Unknown window measure: {by}")
+        if size <= 0:
+            raise ValueError("Window size must be positive")
+        self.size = size
+        self.kind = kind
+        self.by = by
+        self.total = 0.0
+        self.count = 0
+        self.last_closed: Optional[Dict[str, float]] = None
+        self._events: Deque[Tuple[float, float]] = deque()
+        self._start: Optional[float] = None
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        """Add one event to the window.
+
+        Args:
+            value (float): Event value.
+            timestamp (Optional[float]): Event time in seconds, defaults
+            to time.monotonic(). Only used by time windows.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self.kind == "tumbling":
+            self._add_tumbling(value, timestamp)
+            return
+        self._events.append((timestamp, value))
+        self.total += value
+        self.count += 1
+        if self.by == "count":
+            while self.count > self.size:
+                self._evict()
+        else:
+            while timestamp - self._events[0][0] >= self.size:
+                self._evict()
+
+    def _add_tumbling(self, value: float, timestamp: float) -> None:
+        """Add one event to a tumbling window, closing it when full.
+
+        Args:
+            value (float): Event value.
+            timestamp (float): Event time in seconds.
+        """
+        if self.by == "time":
+            if self._start is None:
+                self._start = timestamp
+            elif timestamp - self._start >= self.size:
+                self._close()
+                elapsed = timestamp - self._start
+                self._start += elapsed - elapsed % self.size
+        self.total += value
+        self.count += 1
+        if self.by == "count" and self.count >= self.size:
+            self._close()
+
+    def _evict(self) -> None:
+        """Drop the oldest event of a sliding window."""
+        _, value = self._events.popleft()
+        self.total -= value
+        self.count -= 1
+
+    def _close(self) -> None:
+        """Publish the current tumbling window and start a new one."""
+        self.last_closed = self.snapshot()
+        self.total = 0.0
+        self.count = 0
+
+    @property
+    def average(self) -> float:
+        """Average value of the events currently in the window."""
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return the current aggregate.
+
+        Returns:
+            Dict[str, float]: Event count, sum and average.
+        """
+        return {"count": self.count, "sum": self.total, "avg": self.average}
+
+
+_COMPARATORS: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+
+Columns = Dict[str, List[Any]]
+Evaluator = Callable[[Columns, int], List[Any]]
+BatchSource = Union[Iterable[List[Any]], AsyncIterable[List[Any]]]
+
+
+class FilterExpression:
+    """Filter expression compiled once into a columnar evaluator.
+
+    Expressions use Python syntax restricted to column names, constants,
+    comparisons, "and", "or" and "not", for example
+    "value > 500 and action == 'buy'". Each node evaluates a whole column
+    at a time, producing one list per node instead of one call per item.
+    A comparison that cannot be made (missing value, mismatched types) is
+    False.
+    """
+
+    def __init__(self, source: str) -> None:
+        """Compile a filter expression.
+
+        Args:
+            source (str): Expression to compile.
+
+        Raises:
+            ValueError: If the expression is invalid or unsupported.
+        """
+        self.source = source
+        try:
+            tree = ast.parse(source, mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid filter expression: {source}") from e
+        self._evaluate = self._compile(tree.body)
+
+    def mask(self, columns: Columns, size: int) -> List[bool]:
+        """Evaluate the expression over columnar data.
+
+        Args:
+            columns (Columns): Column name to values, all of length size.
+            size (int): Number of rows.
+
+        Returns:
+            List[bool]: Whether each row matches.
+        """
+        return [bool(x) for x in self._evaluate(columns, size)]
+
+    def _compile(self, node: ast.AST) -> Evaluator:
+        """Turn an AST node into a column evaluator.
+
+        Args:
+            node (ast.AST): Node of the parsed expression.
+
+        Raises:
+            ValueError: If the node type is not supported.
+
+        Returns:
+            Evaluator: Function computing the node for every row.
+        """
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compile(value) for value in node.values]
+            combine = all if isinstance(node.op, ast.And) else any
+            return lambda cols, n: [
+                combine(row) for row in zip(*(p(cols, n) for p in parts))]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            inner = self._compile(node.operand)
+            return lambda cols, n: [not x for x in inner(cols, n)]
+        if isinstance(node, ast.Compare):
+            return self._compile_compare(node)
+        if isinstance(node, ast.Name):
+            name = node.id
+            return lambda cols, n: cols.get(name) or [None] * n
+        if isinstance(node, (ast.Constant, ast.Tuple, ast.List, ast.Set)):
+            try:
+                value = ast.literal_eval(node)
+            except ValueError as e:
+                raise ValueError(
+                    f"Unsupported literal in filter: {self.source}") from e
+            return lambda cols, n: [value] * n
+        raise ValueError(
+            f"Unsupported syntax in filter: {type(node).__name__}")
+
+    def _compile_compare(self, node: ast.Compare) -> Evaluator:
+        """Compile a possibly chained comparison.
+
+        Args:
+            node (ast.Compare): Comparison node.
+
+        Raises:
+            ValueError: If a comparison operator is not supported.
+
+        Returns:
+            Evaluator: Function computing the comparison for every row.
+        """
+        operands = [self._compile(node.left)]
+        operands += [self._compile(c) for c in node.comparators]
+        ops = []
+        for op in node.ops:
+            if type(op) not in _COMPARATORS:
+                raise ValueError(
+                    f"Unsupported operator in filter: {type(op).__name__}")
+            ops.append(_COMPARATORS[type(op)])
+
+        def evaluate(cols: Columns, n: int) -> List[Any]:
+            values = [operand(cols, n) for operand in operands]
+            result = [True] * n
+            for i, op in enumerate(ops):
+                left, right = values[i], values[i + 1]
+                try:
+                    step = [op(a, b) for a, b in zip(left, right)]
+                except TypeError:
+                    step = [self._safe(op, a, b) for a, b in zip(left, right)]
+                result = [r and s for r, s in zip(result, step)]
+            return result
+        return evaluate
+
+    @staticmethod
+    def _safe(op: Callable[[Any, Any], bool], a: Any, b: Any) -> bool:
+        """Apply a comparison, treating incomparable values as no match.
+
+        Args:
+            op (Callable[[Any, Any], bool]): Comparison to apply.
+            a (Any): Left value.
+            b (Any): Right value.
+
+        Returns:
+            bool: Comparison result, False if it raised TypeError.
+        """
+        try:
+            return op(a, b)
+        except TypeError:
+            return False
+
+
+@lru_cache(maxsize=256)
+def compile_filter(source: str) -> FilterExpression:
+    """Compile a filter expression, reusing earlier compilations.
+
+    Args:
+        source (str): Expression to compile.
+
+    Returns:
+        FilterExpression: Compiled expression.
+    """
+    return FilterExpression(source)
+
+
+WIRE_MAGIC = b"NXB1"
+WIRE_HEADER = struct.Struct("<4sBHI")
+WIRE_KEY_LENGTH = struct.Struct("<H")
+WIRE_SENSOR = 1
+WIRE_TRANSACTION = 2
+WIRE_EVENT = 3
+WIRE_VALUE_TYPES: Dict[int, Optional[str]] = {
+    WIRE_SENSOR: "d",
+    WIRE_TRANSACTION: "q",
+    WIRE_EVENT: None,
+}
+
+
+class BinaryBatch:
+    """Batch decoded from the binary wire format.
+
+    Readings are stored as a table of distinct keys, one key code per
+    reading and, for sensor and transaction batches, one packed value per
+    reading. codes and values are memoryviews over the received buffer.
+    """
+
+    def __init__(self, tag: int, keys: List[str], codes: memoryview,
+                 values: Optional[memoryview]) -> None:
+        """Wrap decoded batch parts.
+
+        Args:
+            tag (int): Batch type, one of the WIRE_* constants.
+            keys (List[str]): Distinct keys, indexed by code.
+            codes (memoryview): Key code of every reading.
+            values (Optional[memoryview]): Value of every reading, None for
+            event batches.
+        """
+        self.tag = tag
+        self.keys = keys
+        self.codes = codes
+        self.values = values
+
+    def __len__(self) -> int:
+        """Return the number of readings."""
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the readings in the textual format."""
+        return iter(self.items())
+
+    def key_list(self) -> List[str]:
+        """Return the key of every reading.
+
+        Returns:
+            List[str]: Keys, in reading order.
+        """
+        keys = self.keys
+        return [keys[code] for code in self.codes]
+
+    def items(self) -> List[str]:
+        """Rebuild the "key:value" strings of the batch.
+
+        Returns:
+            List[str]: Readings in the textual format.
+        """
+        if self.values is None:
+            return self.key_list()
+        return [f"{key}:{value}"
+                for key, value in zip(self.key_list(), self.values)]
+
+    def columns(self) -> Dict[str, array]:
+        """Group values by key.
+
+        Returns:
+            Dict[str, array]: Values of every key, in reading order.
+        """
+        if self.values is None:
+            return {}
+        typecode = self.values.format
+        columns = [array(typecode) for _ in self.keys]
+        for code, value in zip(self.codes, self.values):
+            columns[code].append(value)
+        return dict(zip(self.keys, columns))
+
+
+def encode_batch(tag: int, data_batch: List[Any]) -> bytes:
+    """Encode a batch of "key:value" strings in the binary wire format.
+
+    Layout: header (magic, tag, key count, reading count), key table
+    (length-prefixed UTF-8), uint16 key codes, padding to 8 bytes, then
+    the packed values (float64 for sensors, int64 for transactions, none
+    for events). Numbers are little-endian.
+
+    Args:
+        tag (int): Batch type, one of the WIRE_* constants.
+        data_batch (List[Any]): Readings to encode.
+
+    Raises:
+        ValueError: If the tag is unknown, a value cannot be packed, or
+        the batch has more than 65535 distinct keys or a key longer
+        than 65535 bytes.
+
+    Returns:
+        bytes: Encoded batch.
+    """
+    if tag not in WIRE_VALUE_TYPES:
+        raise ValueError(f"Unknown batch type: {tag}")
+    typecode = WIRE_VALUE_TYPES[tag]
+    key_codes: Dict[str, int] = {}
+    codes = array("H")
+    values = array(typecode) if typecode else None
+    for item in data_batch:
+        if values is None:
+            key = str(item)
+        else:
+            key, _, raw = str(item).partition(":")
+            values.append(float(raw) if typecode == "d" else int(raw))
+        code = key_codes.setdefault(key, len(key_codes))
+        if code > 0xFFFE:
+            raise ValueError("Too many distinct keys for one batch")
+        codes.append(code)
+
+    parts = [WIRE_HEADER.pack(WIRE_MAGIC, tag, len(key_codes), len(codes))]
+    for key in key_codes:
+        raw_key = key.encode()
+        if len(raw_key) > 0xFFFF:
+            raise ValueError(f"Key too long: {key[:20]}...")
+        parts.append(WIRE_KEY_LENGTH.pack(len(raw_key)))
+        parts.append(raw_key)
+    if sys.byteorder == "big":
+        codes.byteswap()
+    parts.append(codes.tobytes())
+    if values is not None:
+        size = sum(len(part) for part in parts)
+        parts.append(b"\0" * (-size % 8))
+        if sys.byteorder == "big":
+            values.byteswap()
+        parts.append(values.tobytes())
+    return b"".join(parts)
+
+
+def decode_batch(buffer: Any) -> BinaryBatch:
+    """Decode a binary batch without copying codes or values.
+
+    Args:
+        buffer (Any): Bytes-like object holding an encoded batch.
+
+    Every length, offset and key code is checked against the buffer,
+    so malformed input only raises ValueError.
+
+    Raises:
+        ValueError: If the buffer is not a valid batch.
+
+    Returns:
+        BinaryBatch: Batch whose codes and values view the buffer.
+    """
+    view = memoryview(buffer).cast("B")
+    try:
+        magic, tag, key_count, count = WIRE_HEADER.unpack_from(view)
+    except struct.error as e:
+        raise ValueError("Truncated batch header") from e
+    if magic != WIRE_MAGIC or tag not in WIRE_VALUE_TYPES:
+        raise ValueError("Not a binary stream batch")
+    offset = WIRE_HEADER.size
+    keys = []
+    for _ in range(key_count):
+        if offset + WIRE_KEY_LENGTH.size > len(view):
+            raise ValueError("Truncated key table")
+        (length,) = WIRE_KEY_LENGTH.unpack_from(view, offset)
+        offset += WIRE_KEY_LENGTH.size
+        if offset + length > len(view):
+            raise ValueError("Truncated key table")
+        try:
+            keys.append(bytes(view[offset:offset + length]).decode())
+        except UnicodeDecodeError as e:
+            raise ValueError("Invalid key encoding") from e
+        offset += length
+    codes = _wire_array(view, offset, count, "H")
+    if count and max(codes) >= key_count:
+        raise ValueError("Key code out of range")
+    offset += 2 * count
+    values = None
+    typecode = WIRE_VALUE_TYPES[tag]
+    if typecode:
+        offset += -offset % 8
+        values = _wire_array(view, offset, count, typecode)
+    return BinaryBatch(tag, keys, codes, values)
+
+
+def _wire_array(view: memoryview, offset: int, count: int,
+                typecode: str) -> memoryview:
+    """View count little-endian items of a buffer as a typed memoryview.
+
+    Args:
+        view (memoryview): Byte view of the whole batch.
+        offset (int): Start of the items.
+        count (int): Number of items.
+        typecode (str): Item type, as used by array.
+
+    Raises:
+        ValueError: If the buffer is too short.
+
+    Returns:
+        memoryview: Typed view, copied only on big-endian hosts.
+    """
+    size = array(typecode).itemsize * count
+    if offset + size > len(view):
+        raise ValueError("Truncated batch body")
+    chunk = view[offset:offset + size]
+    if sys.byteorder == "big":
+        swapped = array(typecode, bytes(chunk))
+        swapped.byteswap()
+        return memoryview(swapped)
+    return chunk.cast(typecode)
 
 
 class DataStream(ABC):
@@ -15,6 +520,7 @@ class DataStream(ABC):
         """
         self.stream_id = stream_id
         self.status = "active"
+        self.window: Optional[StreamWindow] = None
 
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
@@ -46,6 +552,106 @@ class DataStream(ABC):
         return [item for item in data_batch
                 if str(criteria) in str(item)]
 
+    def to_columns(self, data_batch: List[Any]) -> Columns:
+        """Parse a batch once into columns usable by filter expressions.
+
+        "key:value" items give a "key" column and a "value" column, with
+        numeric values converted; other items only fill "key".
+
+        Args:
+            data_batch (List[Any]): List of data items.
+
+        Returns:
+            Columns: Column name to list of values, one entry per item.
+        """
+        if isinstance(data_batch, BinaryBatch):
+            if data_batch.values is None:
+                return {"key": data_batch.key_list(),
+                        "value": [None] * len(data_batch)}
+            return {"key": data_batch.key_list(),
+                    "value": data_batch.values.tolist()}
+        keys: List[Any] = []
+        values: List[Any] = []
+        for item in data_batch:
+            key, sep, value = str(item).partition(":")
+            keys.append(key)
+            values.append(_parse_value(value) if sep else None)
+        return {"key": keys, "value": values}
+
+    def filter_expr(self, data_batch: List[Any], *expressions: str,
+                    columns: Optional[Columns] = None) -> List[Any]:
+        """Filter a batch with one or more filter expressions.
+
+        All expressions must match; they are joined into a single
+        compiled expression evaluated in one pass over the columns.
+
+        Args:
+            data_batch (List[Any]): The data to filter.
+            *expressions (str): Filter expressions, see FilterExpression.
+            columns (Optional[Columns]): Columns already built by
+            to_columns for this batch, to share parsing between filters.
+
+        Returns:
+            List[Any]: Items matching every expression.
+        """
+        if not expressions:
+            return data_batch
+        if columns is None:
+            columns = self.to_columns(data_batch)
+        source = " and ".join(f"({e})" for e in expressions)
+        mask = compile_filter(source).mask(columns, len(data_batch))
+        return [item for item, keep in zip(data_batch, mask) if keep]
+
+    def window_values(self, data_batch: List[Any]) -> List[float]:
+        """Extract the per-event values aggregated by the window.
+
+        Args:
+            data_batch (List[Any]): List of data items.
+
+        Returns:
+            List[float]: One value per relevant event.
+        """
+        return []
+
+    def enable_window(self, size: float, kind: str = "sliding",
+                      by: str = "count") -> StreamWindow:
+        """Attach a window aggregating values across batches.
+
+        Args:
+            size (float): Window length, in events or in seconds.
+            kind (str): "sliding" or "tumbling".
+            by (str): "count" or "time".
+
+        Returns:
+            StreamWindow: The attached window.
+        """
+        self.window = StreamWindow(size, kind, by)
+        return self.window
+
+    def update_window(self, data_batch: List[Any],
+                      timestamp: Optional[float] = None) -> Dict[str, float]:
+        """Feed a batch into the attached window.
+
+        Args:
+            data_batch (List[Any]): List of data items.
+            timestamp (Optional[float]): Arrival time of the batch in
+            seconds, defaults to now.
+
+        Raises:
+            RuntimeError: If no window is attached.
+
+        Returns:
+            Dict[str, float]: Current window aggregate.
+        """
+        if self.window is None:
+            raise RuntimeError("No window enabled on this stream")
+        if timestamp is None:
+            timestamp = time.monotonic()
+        add = self.window.add
+        for value in self.window_values(data_batch):
+            add(value, timestamp)
+        return self.window.snapshot()
+
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Retrieve stream statistics.
 
@@ -72,19 +678,82 @@ class SensorStream(DataStream):
         Returns:
             str: Formatted string with reading count and average temperature.
         """
-        temps = []
-        for item in data_batch:
-            if isinstance(item, str) and "temp:" in item:
-                try:
-                    val = float(item.split(":")[1])
-                    temps.append(val)
-                except ValueError:
-                    continue
-
+        temps = self.parse_columns(data_batch).get("temp")
         avg = sum(temps) / len(temps) if temps else 0
         return f"Sensor analysis: {len(data_batch)} readings processed, \
 avg temp: {avg:.1f}°C"
 
+    def window_values(self, data_batch: List[Any]) -> List[float]:
+        """Use temperature readings as window values.
+
+        Args:
+            data_batch (List[Any]): List of sensor reading strings.
+
+        Returns:
+            List[float]: Temperatures, giving a running avg temp.
+        """
+        return list(self.parse_columns(data_batch).get("temp", ()))
+
+    @staticmethod
+    def parse_columns(data_batch: List[Any]) -> Dict[str, array]:
+        """Parse a batch of "key:value" readings into typed columns.
+
+        The batch is split in a single pass, then each column is converted
+        to floats in bulk. Readings that are not strings or whose value is
+        not a number are skipped.
+
+        Args:
+            data_batch (List[Any]): List of sensor reading strings, or a
+            decoded BinaryBatch whose values are grouped directly.
+
+        Returns:
+            Dict[str, array]: Array of doubles for every key seen.
+        """
+        if isinstance(data_batch, BinaryBatch):
+            return data_batch.columns()
+        raw: Dict[str, List[str]] = {}
+        for item in data_batch:
+            if isinstance(item, str):
+                key, sep, value = item.partition(":")
+                if sep:
+                    raw.setdefault(key, []).append(value)
+
+        columns: Dict[str, array] = {}
+        for key, values in raw.items():
+            try:
+                columns[key] = array("d", map(float, values))
+            except ValueError:
+                column = array("d")
+                for value in values:
+                    try:
+                        column.append(float(value))
+                    except ValueError:
+                        continue
+                columns[key] = column
+        return columns
+
+    @staticmethod
+    def aggregate(
+            columns: Dict[str, array]) -> Dict[str, Dict[str, float]]:
+        """Compute per-key aggregates from parsed columns.
+
+        Args:
+            columns (Dict[str, array]): Columns from parse_columns.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Count, min, max and average for
+            every non-empty column.
+        """
+        return {
+            key: {
+                "count": len(column),
+                "min": min(column),
+                "max": max(column),
+                "avg": sum(column) / len(column)
+            }
+            for key, column in columns.items() if column
+        }
+
     def filter_data(
             self, data_batch: List[Any],
             criteria: Optional[str] = None) -> List[Any]:
@@ -115,19 +784,35 @@ class TransactionStream(DataStream):
         Returns:
             str: Formatted string with operation count and net flow value.
         """
-        net_flow = 0
+        net_flow = sum(self.window_values(data_batch))
+        sign = "+" if net_flow >= 0 else ""
+        return f"Transaction analysis: {len(data_batch)} operations, \
+net flow: {sign}{net_flow} units"
+
+    def window_values(self, data_batch: List[Any]) -> List[int]:
+        """Use signed amounts (buy positive, sell negative) as values.
+
+        Args:
+            data_batch (List[Any]): List of transaction strings.
+
+        Returns:
+            List[int]: Signed amounts, giving a running net flow.
+        """
+        if isinstance(data_batch, BinaryBatch):
+            signs = [1 if key == "buy" else -1 if key == "sell" else 0
+                     for key in data_batch.keys]
+            return [signs[code] * value for code, value
+                    in zip(data_batch.codes, data_batch.values)]
+        values = []
         for item in data_batch:
             if isinstance(item, str) and ":" in item:
                 action, val_str = item.split(":")
                 val = int(val_str)
                 if action == "buy":
-                    net_flow += val
+                    values.append(val)
                 elif action == "sell":
-                    net_flow -= val
-
-        sign = "+" if net_flow >= 0 else ""
-        return f"Transaction analysis: {len(data_batch)} operations, \
-net flow: {sign}{net_flow} units"
+                    values.append(-val)
+        return values
 
     def filter_data(
             self, data_batch: List[Any],
@@ -142,26 +827,181 @@ net flow: {sign}{net_flow} units"
             List[Any]: Filtered transactions.
         """
         if criteria == "high_value":
-            return [x for x in data_batch if int(x.split(":")[1]) > 500]
+            return self.filter_expr(data_batch, "value > 500")
         return data_batch
 
+    def to_columns(self, data_batch: List[Any]) -> Columns:
+        """Parse transactions into "action" and "value" columns.
+
+        Args:
+            data_batch (List[Any]): List of transaction strings.
+
+        Returns:
+            Columns: Generic columns plus "action", an alias of "key".
+        """
+        columns = super().to_columns(data_batch)
+        columns["action"] = columns["key"]
+        return columns
+
+
+class EventIndex:
+    """Incremental index of event types across batches.
+
+    Every event gets a global position. Each type keeps its total count,
+    its first position and the positions it holds among the last window
+    events, in increasing order, so counts, first/last occurrences and
+    counts over the last N events are answered without rescanning past
+    batches, in memory bounded by the window.
+
+    Batches may be added from several threads at once: each batch
+    reserves its range of positions under a lock, so positions stay
+    unique and sorted, batches being numbered in the order they are
+    added.
+    """
+
+    def __init__(self, window: int = 10000) -> None:
+        """Initialize an empty index.
+
+        Args:
+            window (int): Number of most recent events whose positions
+            are kept, the largest n accepted by count_recent.
+        """
+        self.window = window
+        self.total = 0
+        self.counts: Dict[Any, int] = {}
+        self.firsts: Dict[Any, int] = {}
+        self.recent: Dict[Any, Deque[int]] = {}
+        self._lock = threading.Lock()
+
+    def add_batch(self, data_batch: List[Any]) -> Dict[Any, int]:
+        """Index a batch in a single pass.
+
+        Events are grouped by type before the lock is taken, the lock
+        only covers the position reservation and the index update.
+
+        Args:
+            data_batch (List[Any]): List of events.
+
+        Returns:
+            Dict[Any, int]: Count of each event type within the batch.
+        """
+        size = len(data_batch)
+        offsets: Dict[Any, List[int]] = {}
+        for offset, event in enumerate(data_batch):
+            offsets.setdefault(event, []).append(offset)
+        kept = size - self.window
+        with self._lock:
+            start = self.total
+            self.total += size
+            for event, found in offsets.items():
+                self.counts[event] = self.counts.get(event, 0) + len(found)
+                self.firsts.setdefault(event, start + found[0])
+                recent = self.recent.get(event)
+                if recent is None:
+                    recent = self.recent[event] = deque(maxlen=self.window)
+                if kept > 0:
+                    found = found[bisect_left(found, kept):]
+                recent.extend(start + offset for offset in found)
+        return {event: len(found) for event, found in offsets.items()}
+
+    def count(self, event_type: Any) -> int:
+        """Return how many events of a type were seen.
+
+        Args:
+            event_type (Any): Event type.
+
+        Returns:
+            int: Total occurrences.
+        """
+        return self.counts.get(event_type, 0)
+
+    def first(self, event_type: Any) -> Optional[int]:
+        """Return the position of the first event of a type.
+
+        Args:
+            event_type (Any): Event type.
+
+        Returns:
+            Optional[int]: Global position, None if never seen.
+        """
+        return self.firsts.get(event_type)
+
+    def last(self, event_type: Any) -> Optional[int]:
+        """Return the position of the latest event of a type.
+
+        Args:
+            event_type (Any): Event type.
+
+        Returns:
+            Optional[int]: Global position, None if never seen.
+        """
+        recent = self.recent.get(event_type)
+        return recent[-1] if recent else None
+
+    def count_recent(self, event_type: Any, n: int) -> int:
+        """Count events of a type among the last n events.
+
+        Args:
+            event_type (Any): Event type.
+            n (int): Number of most recent events considered.
+
+        Raises:
+            ValueError: If n exceeds the window of the index.
+
+        Returns:
+            int: Occurrences within the last n events.
+        """
+        if n > self.window:
+            raise ValueError(
+                f"count_recent covers at most the last {self.window} events")
+        with self._lock:
+            recent = self.recent.get(event_type, ())
+            return len(recent) - bisect_left(recent, self.total - n)
+
 
 class EventStream(DataStream):
     """Data stream handler for system events."""
 
+    def __init__(self, stream_id: str):
+        """Initialize the event stream and its event type index.
+
+        Args:
+            stream_id (str): Unique identifier for the stream.
+        """
+        super().__init__(stream_id)
+        self.index = EventIndex()
+
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process event data to count errors.
 
+        The batch is added to the stream's event index, which keeps the
+        counts of every event type.
+
         Args:
             data_batch (List[Any]): List of event strings.
 
         Returns:
             str: Formatted string with total events and error count.
         """
-        errors = data_batch.count("error")
+        if isinstance(data_batch, BinaryBatch):
+            data_batch = data_batch.key_list()
+        errors = self.index.add_batch(data_batch).get("error", 0)
         return f"Event analysis: {len(data_batch)} events, {errors} \
 error detected"
 
+    def window_values(self, data_batch: List[Any]) -> List[float]:
+        """Use 1 for errors and 0 for other events as window values.
+
+        Args:
+            data_batch (List[Any]): List of event strings.
+
+        Returns:
+            List[float]: Error indicators, giving errors per window.
+        """
+        if isinstance(data_batch, BinaryBatch):
+            data_batch = data_batch.key_list()
+        return [1.0 if item == "error" else 0.0 for item in data_batch]
+
 
 class StreamProcessor:
     """Processor class for managing stream batch execution."""
@@ -185,6 +1025,106 @@ class StreamProcessor:
             print(f"[ERROR] Stream processing failed: {e}")
 
 
+class AsyncStreamProcessor:
+    """Asyncio processor consuming many stream sources concurrently.
+
+    Each source feeds a bounded asyncio.Queue, so a fast producer waits
+    when its consumers fall behind. Every stream gets its own pool of
+    consumer tasks, and process_batch calls run in an executor so that
+    CPU-heavy work does not block the event loop.
+    """
+
+    def __init__(self, queue_size: int = 16, concurrency: int = 1,
+                 executor: Optional[Executor] = None) -> None:
+        """Initialize the processor.
+
+        Args:
+            queue_size (int): Maximum number of pending batches per stream.
+            concurrency (int): Batches processed at once per stream.
+            executor (Optional[Executor]): Executor running process_batch,
+            defaults to the loop's thread pool. With a process pool,
+            stream state changed by process_batch stays in the workers.
+        """
+        self.queue_size = queue_size
+        self.concurrency = concurrency
+        self.executor = executor
+
+    async def run(
+            self, sources: List[Tuple[DataStream, BatchSource]]
+    ) -> Dict[str, List[str]]:
+        """Process every source until exhausted.
+
+        Args:
+            sources (List[Tuple[DataStream, BatchSource]]): Streams paired
+            with an iterable or async iterable of batches.
+
+        Returns:
+            Dict[str, List[str]]: Results per stream id, in batch order.
+        """
+        results: Dict[str, List[str]] = {}
+        tasks = []
+        for stream, batches in sources:
+            if not isinstance(stream, DataStream):
+                print(f"[ERROR] Invalid stream type: {type(stream)}")
+                continue
+            output: List[str] = results.setdefault(stream.stream_id, [])
+            tasks.append(self._run_stream(stream, batches, output))
+        await asyncio.gather(*tasks)
+        return results
+
+    async def _run_stream(self, stream: DataStream, batches: BatchSource,
+                          output: List[str]) -> None:
+        """Run the producer and consumers of one stream.
+
+        Args:
+            stream (DataStream): Stream processing the batches.
+            batches (BatchSource): Batches to process.
+            output (List[str]): List receiving results in batch order.
+        """
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        slots: Dict[int, str] = {}
+        consumers = [asyncio.create_task(self._consume(stream, queue, slots))
+                     for _ in range(self.concurrency)]
+        try:
+            index = 0
+            if hasattr(batches, "__aiter__"):
+                async for batch in batches:
+                    await queue.put((index, batch))
+                    index += 1
+            else:
+                for batch in batches:
+                    await queue.put((index, batch))
+                    index += 1
+            for _ in consumers:
+                await queue.put(None)
+            await asyncio.gather(*consumers)
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+        output.extend(slots[i] for i in range(len(slots)))
+
+    async def _consume(self, stream: DataStream, queue: asyncio.Queue,
+                       slots: Dict[int, str]) -> None:
+        """Process batches from a queue until a None sentinel arrives.
+
+        Args:
+            stream (DataStream): Stream processing the batches.
+            queue (asyncio.Queue): Queue of (index, batch) pairs.
+            slots (Dict[int, str]): Results keyed by batch index.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+            index, batch = entry
+            try:
+                slots[index] = await loop.run_in_executor(
+                    self.executor, stream.process_batch, batch)
+            except Exception as e:
+                slots[index] = f"[ERROR] Stream processing failed: {e}"
+
+
 def main():
     """Run the polymorphic stream system demonstration."""
     print("=== CODE NEXUS - POLYMORPHIC STREAM SYSTEM ===")
@@ -1,6 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Protocol
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from itertools import islice
+from typing import (
+    Any, Deque, Dict, Iterable, Iterator, List, Optional, Protocol, TextIO,
+    Tuple
+)
+import csv
+import io
 import json
+import os
+import queue
+import sys
+import threading
+import time
+
+_STOP = object()
+_print_lock = threading.Lock()
 
 
 class ProcessingStage(Protocol):
@@ -18,9 +35,164 @@ class ProcessingStage(Protocol):
         ...
 
 
+class BatchProcessingStage(ProcessingStage, Protocol):
+    """Protocol for a stage that can also process many records at once.
+
+    Pipelines use process_batch when a stage provides it and fall back to
+    calling process per record otherwise.
+    """
+
+    def process_batch(self, items: List[Any]) -> List[Any]:
+        """Process several records and return results in the same order.
+
+        Args:
+            items (List[Any]): Input records.
+
+        Returns:
+            List[Any]: Processed records.
+        """
+        ...
+
+
+def _print_lines(lines: List[str]) -> None:
+    """Print several log lines with a single write.
+
+    The write holds a lock, so lines logged by stages running in
+    different threads never interleave.
+
+    Args:
+        lines (List[str]): Lines to print, empty strings are skipped.
+    """
+    lines = [line for line in lines if line]
+    if lines:
+        text = "\n".join(lines) + "\n"
+        with _print_lock:
+            sys.stdout.write(text)
+
+
+def _typed(value: str) -> Any:
+    """Convert a CSV field to int or float when it is numeric.
+
+    Args:
+        value (str): Raw field.
+
+    Returns:
+        Any: Parsed number, or the field unchanged.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class CSVBatch:
+    """Batch of typed rows parsed from a CSV stream."""
+
+    def __init__(self, headers: List[str], rows: List[List[Any]]) -> None:
+        """Initialize the batch.
+
+        Args:
+            headers (List[str]): Column names.
+            rows (List[List[Any]]): Typed field values, one list per row.
+        """
+        self.headers = headers
+        self.rows = rows
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        """Summarize the batch without printing every row."""
+        return f"CSV batch: {len(self.rows)} rows x {len(self.headers)} \
+columns"
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return the rows as dictionaries keyed by header.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per row.
+        """
+        return [dict(zip(self.headers, row)) for row in self.rows]
+
+
+class Record(Mapping):
+    """Read-only record made of a shared payload plus overlay fields.
+
+    Stages enrich a record by creating a new Record over the same
+    payload with extra fields, instead of mutating or copying the
+    payload. The payload is never modified, so one input can safely flow
+    through stages shared between pipelines. Overlay fields take
+    precedence over payload keys.
+    """
+
+    __slots__ = ("_payload", "_fields")
+
+    def __init__(self, payload: Mapping,
+                 fields: Optional[Dict[str, Any]] = None) -> None:
+        """Wrap a payload.
+
+        Args:
+            payload (Mapping): Original data, treated as read-only. A
+            Record payload is unwrapped so overlays never nest.
+            fields (Optional[Dict[str, Any]]): Overlay fields.
+        """
+        if isinstance(payload, Record):
+            fields = {**payload._fields, **(fields or {})}
+            payload = payload._payload
+        self._payload = payload
+        self._fields = fields or {}
+
+    def with_fields(self, **fields: Any) -> "Record":
+        """Return a new record adding or overriding fields.
+
+        Args:
+            **fields (Any): Overlay fields to set.
+
+        Returns:
+            Record: Record sharing this record's payload.
+        """
+        return Record(self, fields)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return an overlay field, or the payload value."""
+        if key in self._fields:
+            return self._fields[key]
+        return self._payload[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over payload keys, then overlay-only keys."""
+        yield from self._payload
+        for key in self._fields:
+            if key not in self._payload:
+                yield key
+
+    def __len__(self) -> int:
+        """Return the number of distinct keys."""
+        extra = sum(1 for key in self._fields if key not in self._payload)
+        return len(self._payload) + extra
+
+    def __repr__(self) -> str:
+        """Show the merged content."""
+        return f"Record({dict(self)!r})"
+
+
 class InputStage:
     """Stage for validating initial input."""
 
+    def __init__(self, log_json: bool = False) -> None:
+        """Initialize the stage.
+
+        Args:
+            log_json (bool): Log dict inputs re-serialized as JSON. Off by
+            default, dict inputs are then only summarized.
+        """
+        self.log_json = log_json
+
     def process(self, data: Any) -> Any:
         """Validate input is not empty.
 
@@ -33,18 +205,60 @@ class InputStage:
         Returns:
             Any: Validated data.
         """
+        data, line = self._process_one(data)
+        _print_lines([line])
+        return data
+
+    def process_batch(self, items: List[Any]) -> List[Any]:
+        """Validate several inputs, logging them in one write.
+
+        Args:
+            items (List[Any]): Input records.
+
+        Raises:
+            ValueError: If a record is empty.
+
+        Returns:
+            List[Any]: Validated records.
+        """
+        results = []
+        lines = []
+        for data in items:
+            data, line = self._process_one(data)
+            results.append(data)
+            lines.append(line)
+        _print_lines(lines)
+        return results
+
+    def _process_one(self, data: Any) -> Tuple[Any, str]:
+        """Validate one input and build its log line.
+
+        Args:
+            data (Any): Input data.
+
+        Raises:
+            ValueError: If data is empty.
+
+        Returns:
+            Tuple[Any, str]: Validated data and log line.
+        """
+        line = ""
         if data == "INVALID_DATA":
             pass
-        elif isinstance(data, dict):
-            print(f"Input: {json.dumps(data)}")
+        elif isinstance(data, Mapping):
+            if self.log_json:
+                payload = data if isinstance(data, dict) else dict(data)
+                line = f"Input: {json.dumps(payload)}"
+            else:
+                line = f"Input: JSON record ({len(data)} fields)"
         elif isinstance(data, str) and "," in data:
-            print(f'Input: "{data}"')
+            line = f'Input: "{data}"'
         else:
-            print(f"Input: {data}")
+            line = f"Input: {data}"
 
         if not data:
             raise ValueError("Empty data received")
-        return data
+        return data, line
 
 
 class TransformStage:
@@ -62,24 +276,64 @@ class TransformStage:
         Returns:
             Any: Transformed data structure.
         """
+        data, line = self._process_one(data)
+        _print_lines([line])
+        return data
+
+    def process_batch(self, items: List[Any]) -> List[Any]:
+        """Transform several records, logging them in one write.
+
+        Args:
+            items (List[Any]): Validated input records.
+
+        Raises:
+            ValueError: If a record indicates invalid format.
+
+        Returns:
+            List[Any]: Transformed records.
+        """
+        results = []
+        lines = []
+        for data in items:
+            data, line = self._process_one(data)
+            results.append(data)
+            lines.append(line)
+        _print_lines(lines)
+        return results
+
+    @staticmethod
+    def _process_one(data: Any) -> Tuple[Any, str]:
+        """Transform one record and build its log line.
+
+        Args:
+            data (Any): Validated input data.
+
+        Raises:
+            ValueError: If data indicates invalid format.
+
+        Returns:
+            Tuple[Any, str]: Transformed data and log line.
+        """
         msg = "Unknown transformation"
 
-        if isinstance(data, dict) and "sensor" in data:
+        if isinstance(data, Mapping) and "sensor" in data:
             msg = "Enriched with metadata and validation"
-            data["status"] = "valid"
+            data = Record(data, {"status": "valid"})
 
         elif isinstance(data, str) and "," in data:
             msg = "Parsed and structured data"
             parts = data.split(",")
             data = {"type": "csv", "headers": parts, "count": 1}
 
+        elif isinstance(data, CSVBatch):
+            msg = f"Parsed and structured {len(data)} rows"
+
         elif data == "INVALID_DATA":
             raise ValueError("Invalid data format")
         else:
             msg = "Aggregated and filtered"
 
-        print(f"Transform: {msg}")
-        return data
+        return data, f"Transform: {msg}"
 
 
 class OutputStage:
@@ -88,6 +342,33 @@ class OutputStage:
     def process(self, data: Any) -> str:
         """Format processed data into output string.
 
+        Args:
+            data (Any): Processed/Transformed data.
+
+        Returns:
+            str: Final output message.
+        """
+        output = self._format(data)
+        _print_lines([f"Output: {output}"])
+        return output
+
+    def process_batch(self, items: List[Any]) -> List[str]:
+        """Format several records, logging them in one write.
+
+        Args:
+            items (List[Any]): Processed/Transformed records.
+
+        Returns:
+            List[str]: Final output messages.
+        """
+        outputs = [self._format(data) for data in items]
+        _print_lines([f"Output: {output}" for output in outputs])
+        return outputs
+
+    @staticmethod
+    def _format(data: Any) -> str:
+        """Build the output message of one record.
+
         Args:
             data (Any): Processed/Transformed data.
 
@@ -96,22 +377,308 @@ class OutputStage:
         """
         output = ""
 
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             if "sensor" in data:
                 output = f"Processed temperature reading: {data.get('value')}\
 °C (Normal range)"
             elif data.get("type") == "csv":
                 output = f"User activity logged: {data.get('count')} \
 actions processed"
+        elif isinstance(data, CSVBatch):
+            output = f"User activity logged: {len(data)} actions processed"
         else:
             output = "Stream summary: 5 readings, avg: 22.1°C"
 
-        print(f"Output: {output}")
         return output
 
 
+class LatencyHistogram:
+    """Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are grouped in buckets whose width is a fixed fraction of the
+    value (SUB_BUCKET_BITS significant bits), so recording is O(1) and
+    memory only grows with the logarithm of the value range.
+    """
+
+    SUB_BUCKET_BITS = 5
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+
+    def record(self, value: int) -> None:
+        """Record one value.
+
+        Args:
+            value (int): Non-negative value, in nanoseconds.
+        """
+        shift = max(value.bit_length() - self.SUB_BUCKET_BITS - 1, 0)
+        key = (shift << (self.SUB_BUCKET_BITS + 1)) + (value >> shift)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.count += 1
+
+    def percentile(self, q: float) -> int:
+        """Estimate the value below which a fraction q of values fall.
+
+        Args:
+            q (float): Fraction in [0, 1].
+
+        Returns:
+            int: Middle of the matching bucket, 0 if empty.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, round(q * self.count))
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen >= rank:
+                break
+        shift = key >> (self.SUB_BUCKET_BITS + 1)
+        mantissa = key & ((1 << (self.SUB_BUCKET_BITS + 1)) - 1)
+        return (mantissa << shift) + ((1 << shift) >> 1)
+
+
+class StageMetrics:
+    """Counters and latency distribution of one instrumented step.
+
+    Recording is guarded by a lock, as pipelined stages record from
+    several worker threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.calls = 0
+        self.items = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.latency = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ns: int, items: int = 1,
+               error: bool = False) -> None:
+        """Record one call.
+
+        Args:
+            elapsed_ns (int): Duration of the call in nanoseconds.
+            items (int): Records handled by the call.
+            error (bool): Whether the call raised.
+        """
+        with self._lock:
+            self.calls += 1
+            self.items += items
+            self.errors += error
+            self.total_ns += elapsed_ns
+            self.latency.record(elapsed_ns)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return the current values.
+
+        Returns:
+            Dict[str, float]: Counts, cumulative time in seconds, items
+            per second of processing time and p50/p95/p99 call latency
+            in seconds.
+        """
+        seconds = self.total_ns / 1e9
+        return {
+            "calls": self.calls,
+            "items": self.items,
+            "errors": self.errors,
+            "seconds": seconds,
+            "items_per_second": self.items / seconds if seconds else 0.0,
+            "p50": self.latency.percentile(0.50) / 1e9,
+            "p95": self.latency.percentile(0.95) / 1e9,
+            "p99": self.latency.percentile(0.99) / 1e9,
+        }
+
+
+class MetricsRegistry:
+    """Named StageMetrics shared by pipelines and the manager.
+
+    Plain named counters and gauges, such as the rows read by an
+    adapter, are kept alongside and exported with them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.metrics: Dict[str, StageMetrics] = {}
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> StageMetrics:
+        """Return the metrics of a name, creating them if needed.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            StageMetrics: Metrics registered under name.
+        """
+        metrics = self.metrics.get(name)
+        if metrics is None:
+            metrics = self.metrics[name] = StageMetrics()
+        return metrics
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """Add to a named counter, creating it if needed.
+
+        Args:
+            name (str): Counter name.
+            amount (float): Value added.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a named gauge.
+
+        Args:
+            name (str): Gauge name.
+            value (float): Current value.
+        """
+        self.gauges[name] = value
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return the current values of every metric.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Snapshot per metric name.
+        """
+        return {name: metrics.snapshot()
+                for name, metrics in self.metrics.items()}
+
+    def export_prometheus(self, path: str) -> None:
+        """Write all metrics to a file in Prometheus text format.
+
+        The file is written next to its destination and renamed, so a
+        scraper never reads a partial file.
+
+        Args:
+            path (str): Destination file.
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for metric, kind, field in (
+                ("nexus_calls_total", "counter", "calls"),
+                ("nexus_items_total", "counter", "items"),
+                ("nexus_errors_total", "counter", "errors"),
+                ("nexus_items_per_second", "gauge", "items_per_second")):
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in snapshot.items():
+                lines.append(f'{metric}{{stage="{name}"}} {values[field]}')
+        lines.append("# TYPE nexus_latency_seconds summary")
+        for name, values in snapshot.items():
+            for quantile in ("p50", "p95", "p99"):
+                lines.append(
+                    f'nexus_latency_seconds{{stage="{name}",'
+                    f'quantile="0.{quantile[1:]}"}} {values[quantile]}')
+            lines.append(
+                f'nexus_latency_seconds_sum{{stage="{name}"}} '
+                f'{values["seconds"]}')
+            lines.append(
+                f'nexus_latency_seconds_count{{stage="{name}"}} '
+                f'{values["calls"]}')
+        for metric, kind, values in (
+                ("nexus_adapter_total", "counter", self.counters),
+                ("nexus_adapter_value", "gauge", self.gauges)):
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, value in sorted(values.items()):
+                lines.append(f'{metric}{{name="{name}"}} {value}')
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+
+class RetryPolicy:
+    """How many times a failing stage call is attempted."""
+
+    def __init__(self, attempts: int = 1, delay: float = 0.0,
+                 backoff: float = 2.0,
+                 retry_on: Tuple[type, ...] = (Exception,)) -> None:
+        """Initialize the policy.
+
+        Args:
+            attempts (int): Total attempts, 1 means no retry.
+            delay (float): Seconds to wait before the first retry.
+            backoff (float): Factor applied to the delay after each retry.
+            retry_on (Tuple[type, ...]): Exception types worth retrying,
+            others fail immediately.
+        """
+        self.attempts = max(attempts, 1)
+        self.delay = delay
+        self.backoff = backoff
+        self.retry_on = retry_on
+
+
+_NO_RETRY = RetryPolicy()
+
+
+class DeadLetterQueue:
+    """Records that failed every attempt, kept for inspection or replay.
+
+    Entries are kept in memory (the most recent max_size ones) and, when
+    a path is given, appended to it as JSON Lines.
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 max_size: int = 10000) -> None:
+        """Initialize an empty queue.
+
+        Args:
+            path (Optional[str]): JSON Lines file receiving every entry.
+            max_size (int): Entries kept in memory.
+        """
+        self.path = path
+        self.entries: Deque[Dict[str, Any]] = deque(maxlen=max_size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries kept in memory."""
+        return len(self.entries)
+
+    def push(self, offset: Optional[int], stage: str, data: Any,
+             error: Exception) -> None:
+        """Add a failed record.
+
+        Args:
+            offset (Optional[int]): Position of the record in its input.
+            stage (str): Name of the stage that failed.
+            data (Any): Record as it entered the failing stage.
+            error (Exception): Last error raised.
+        """
+        entry = {"offset": offset, "stage": stage, "data": data,
+                 "error": f"{type(error).__name__}: {error}"}
+        with self._lock:
+            self.entries.append(entry)
+            if self.path is not None:
+                with open(self.path, "a") as file:
+                    file.write(json.dumps(entry, default=repr) + "\n")
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Remove and return the entries kept in memory.
+
+        Returns:
+            List[Dict[str, Any]]: Entries, oldest first.
+        """
+        entries = list(self.entries)
+        self.entries.clear()
+        return entries
+
+
 class ProcessingPipeline(ABC):
-    """Abstract base class for processing pipelines."""
+    """Abstract base class for processing pipelines.
+
+    ACCEPTS lists the input types a pipeline handles, used by
+    NexusManager to build its routing table; accepts refines the match
+    on content. The StageMetrics of the pipeline and of each stage are
+    looked up once, when a stage is added or the registry is replaced,
+    so recording a call costs no name formatting or lookup.
+    """
+
+    ACCEPTS: Tuple[type, ...] = (object,)
 
     def __init__(self, pipeline_id: str):
         """Initialize pipeline with identifier.
@@ -121,29 +688,395 @@ class ProcessingPipeline(ABC):
         """
         self.pipeline_id = pipeline_id
         self.stages: List[ProcessingStage] = []
+        self.retry_policies: List[RetryPolicy] = []
+        self.stage_metrics: List[StageMetrics] = []
+        self.registry = MetricsRegistry()
+        self.dead_letters = DeadLetterQueue()
+
+    @property
+    def registry(self) -> MetricsRegistry:
+        """Registry receiving the pipeline metrics."""
+        return self._registry
+
+    @registry.setter
+    def registry(self, registry: MetricsRegistry) -> None:
+        """Record metrics in another registry.
+
+        Args:
+            registry (MetricsRegistry): New registry.
+        """
+        self._registry = registry
+        self.run_metrics = registry.get(self.pipeline_id)
+        self.stage_metrics = [registry.get(self.stage_name(position))
+                              for position in range(len(self.stages))]
 
-    def add_stage(self, stage: ProcessingStage) -> None:
+    def add_stage(self, stage: ProcessingStage,
+                  retry: Optional[RetryPolicy] = None) -> None:
         """Add a processing stage to the pipeline.
 
         Args:
             stage (ProcessingStage): The stage instance to append.
+            retry (Optional[RetryPolicy]): Retry policy of the stage, a
+            single attempt by default.
         """
         self.stages.append(stage)
+        self.retry_policies.append(retry or RetryPolicy())
+        self.stage_metrics.append(
+            self._registry.get(self.stage_name(len(self.stages) - 1)))
+
+    def accepts(self, data: Any) -> bool:
+        """Tell whether a record is meant for this pipeline.
+
+        Args:
+            data (Any): Input record, already matching ACCEPTS by type.
+
+        Returns:
+            bool: True if the pipeline should process the record.
+        """
+        return True
+
+    def stage_name(self, position: int) -> str:
+        """Return the metric name of a stage.
+
+        Args:
+            position (int): Index of the stage.
+
+        Returns:
+            str: Name made of the pipeline ID, position and stage class.
+        """
+        stage = self.stages[position]
+        return f"{self.pipeline_id}.{position}.{type(stage).__name__}"
 
     def _run_stages(self, data: Any) -> Any:
         """Execute all stages sequentially.
 
+        Every stage call and the whole run are timed in the registry. A
+        record failing a stage after all retries is added to
+        dead_letters before the error is raised.
+
         Args:
             data (Any): Initial input data.
 
         Returns:
             Any: Final result after all stages.
         """
+        clock = time.perf_counter_ns
+        begin = clock()
         current_data = data
-        for stage in self.stages:
-            current_data = stage.process(current_data)
+        position = 0
+        try:
+            for position in range(len(self.stages)):
+                current_data = self._call_stage(position, current_data)
+        except Exception as e:
+            self.run_metrics.record(clock() - begin, error=True)
+            self.dead_letters.push(
+                None, self.stage_name(position), current_data, e)
+            raise
+        self.run_metrics.record(clock() - begin)
         return current_data
 
+    def _call_stage(self, position: int, data: Any, batch: bool = False,
+                    executor: Optional[Executor] = None,
+                    retry: bool = True) -> Any:
+        """Run one stage on a record or batch, applying its retry policy.
+
+        Every run mode goes through this method, so retries and metrics
+        behave the same in all of them.
+
+        Args:
+            position (int): Index of the stage.
+            data (Any): Record entering the stage, or list of records.
+            batch (bool): Call process_batch on a list of records instead
+            of process on a single record.
+            executor (Optional[Executor]): Executor running the call, the
+            current thread by default.
+            retry (bool): Apply the retry policy, otherwise make a single
+            attempt.
+
+        Raises:
+            Exception: The last error once all attempts failed.
+
+        Returns:
+            Any: Output of the stage.
+        """
+        stage = self.stages[position]
+        call = stage.process_batch if batch else stage.process
+        if executor is not None:
+            method = call
+
+            def call(data: Any) -> Any:
+                return executor.submit(method, data).result()
+        count = len(data) if batch else 1
+        policy = self.retry_policies[position] if retry else _NO_RETRY
+        metrics = self.stage_metrics[position]
+        delay = policy.delay
+        attempt = 1
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                result = call(data)
+            except Exception as e:
+                metrics.record(time.perf_counter_ns() - start, count,
+                               error=True)
+                if (attempt >= policy.attempts or
+                        not isinstance(e, policy.retry_on)):
+                    raise
+                if delay:
+                    time.sleep(delay)
+                delay *= policy.backoff
+                attempt += 1
+                continue
+            metrics.record(time.perf_counter_ns() - start, count)
+            return result
+
+    def process_resumable(self, items: Iterable[Any],
+                          checkpoint_path: str,
+                          every: int = 1000) -> Iterator[Any]:
+        """Process records, checkpointing progress to resume after a crash.
+
+        Records failing a stage after all retries go to dead_letters and
+        processing continues. Every `every` records, the input offset and
+        the state of stages defining checkpoint_state/restore_state are
+        written to checkpoint_path. When that file exists, the stages are
+        restored and the records before its offset are skipped, so items
+        must be replayed in the same order.
+
+        Args:
+            items (Iterable[Any]): Input records.
+            checkpoint_path (str): JSON checkpoint file.
+            every (int): Records between two checkpoints.
+
+        Returns:
+            Iterator[Any]: Result of every record that did not fail.
+        """
+        start = self._restore_checkpoint(checkpoint_path)
+        done = start
+        clock = time.perf_counter_ns
+        for offset, data in enumerate(islice(items, start, None), start):
+            begin = clock()
+            current = data
+            for position in range(len(self.stages)):
+                try:
+                    current = self._call_stage(position, current)
+                except Exception as e:
+                    self.run_metrics.record(clock() - begin, error=True)
+                    self.dead_letters.push(
+                        offset, self.stage_name(position), current, e)
+                    break
+            else:
+                self.run_metrics.record(clock() - begin)
+                yield current
+            done = offset + 1
+            if done % every == 0:
+                self._save_checkpoint(checkpoint_path, done)
+        self._save_checkpoint(checkpoint_path, done)
+
+    def _save_checkpoint(self, path: str, offset: int) -> None:
+        """Write the input offset and stage states atomically.
+
+        Args:
+            path (str): Checkpoint file.
+            offset (int): Number of input records fully handled.
+        """
+        states = {}
+        for position, stage in enumerate(self.stages):
+            checkpoint_state = getattr(stage, "checkpoint_state", None)
+            if checkpoint_state is not None:
+                states[str(position)] = checkpoint_state()
+        checkpoint = {"pipeline_id": self.pipeline_id, "offset": offset,
+                      "stages": states}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(checkpoint, file)
+        os.replace(tmp_path, path)
+
+    def _restore_checkpoint(self, path: str) -> int:
+        """Restore stage states from a checkpoint file if it exists.
+
+        Args:
+            path (str): Checkpoint file.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another pipeline.
+
+        Returns:
+            int: Offset to resume from, 0 without checkpoint.
+        """
+        try:
+            with open(path) as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return 0
+        if checkpoint["pipeline_id"] != self.pipeline_id:
+            raise ValueError(
+                f"Checkpoint {path} belongs to pipeline "
+                f"{checkpoint['pipeline_id']}")
+        for position, state in checkpoint["stages"].items():
+            self.stages[int(position)].restore_state(state)
+        return checkpoint["offset"]
+
+    def run_pipelined(self, items: Iterable[Any],
+                      concurrency: Optional[List[int]] = None,
+                      queue_size: int = 64,
+                      executor: Optional[Executor] = None) -> List[Any]:
+        """Execute stages concurrently, one worker group per stage.
+
+        Stages are connected by bounded queues, so item N+1 can be in the
+        first stage while item N is in the second. Results are returned
+        in input order. Stages are called with their retry policy; an
+        item whose stage still fails is added to dead_letters, carries
+        the exception instead of a result and skips the remaining stages.
+
+        Workers are threads. Without executor they run the stages
+        themselves, so stages only overlap while they wait on I/O or run
+        code releasing the GIL. For CPU-bound stages, pass a
+        ProcessPoolExecutor: each worker thread then hands its stage
+        call to the pool and waits for it, so stages run in parallel
+        processes. Stages and records must then be picklable, and state
+        a stage changes in a worker process is not seen by the pipeline.
+
+        Args:
+            items (Iterable[Any]): Input data items.
+            concurrency (Optional[List[int]]): Worker threads per stage,
+            one per stage by default. With an executor, this is the
+            number of calls each stage has in flight.
+            queue_size (int): Capacity of each inter-stage queue.
+            executor (Optional[Executor]): Executor running the stage
+            calls, in the worker threads by default.
+
+        Raises:
+            ValueError: If concurrency does not match the stage count.
+            Exception: Any error raised while iterating items, once the
+            items read before it went through the stages.
+
+        Returns:
+            List[Any]: Final result or exception for every item.
+        """
+        if concurrency is None:
+            concurrency = [1] * len(self.stages)
+        if len(concurrency) != len(self.stages):
+            raise ValueError("One concurrency setting per stage required")
+        queues: List["queue.Queue[Any]"] = [
+            queue.Queue(queue_size) for _ in range(len(self.stages) + 1)]
+        remaining = list(concurrency)
+        lock = threading.Lock()
+        clock = time.perf_counter_ns
+        run_metrics = self.run_metrics
+        source_errors: List[BaseException] = []
+
+        def feed() -> None:
+            try:
+                for index, data in enumerate(items):
+                    queues[0].put((index, data, clock()))
+            except BaseException as e:
+                source_errors.append(e)
+            finally:
+                for _ in range(concurrency[0] if concurrency else 1):
+                    queues[0].put(_STOP)
+
+        def work(position: int) -> None:
+            source, target = queues[position], queues[position + 1]
+            while True:
+                entry = source.get()
+                if entry is _STOP:
+                    break
+                index, data, start = entry
+                if not isinstance(data, Exception):
+                    try:
+                        data = self._call_stage(position, data,
+                                                executor=executor)
+                    except Exception as e:
+                        self.dead_letters.push(
+                            index, self.stage_name(position), data, e)
+                        data = e
+                target.put((index, data, start))
+            with lock:
+                remaining[position] -= 1
+                last = remaining[position] == 0
+            if last:
+                following = concurrency[position + 1:position + 2] or [1]
+                for _ in range(following[0]):
+                    target.put(_STOP)
+
+        threads = [threading.Thread(target=feed, daemon=True)]
+        for position, count in enumerate(concurrency):
+            threads += [threading.Thread(target=work, args=(position,),
+                                         daemon=True)
+                        for _ in range(count)]
+        for thread in threads:
+            thread.start()
+
+        results: Dict[int, Any] = {}
+        while True:
+            entry = queues[-1].get()
+            if entry is _STOP:
+                break
+            index, data, start = entry
+            run_metrics.record(clock() - start,
+                               error=isinstance(data, Exception))
+            results[index] = data
+        for thread in threads:
+            thread.join()
+        if source_errors:
+            raise source_errors[0]
+        return [results[index] for index in range(len(results))]
+
+    def _run_stages_batch(self, items: List[Any]) -> List[Any]:
+        """Execute all stages on a batch of records.
+
+        Stages providing process_batch receive the whole batch in a
+        single attempt. When it fails, or when a stage has no
+        process_batch, the records go through that stage one by one with
+        its retry policy, so only the failing records are retried, added
+        to dead_letters (with their offset in the batch) and left out of
+        the results.
+
+        Args:
+            items (List[Any]): Initial input records.
+
+        Returns:
+            List[Any]: Final results of the records that did not fail, in
+            input order.
+        """
+        clock = time.perf_counter_ns
+        current = list(items)
+        offsets = range(len(current))
+        count = len(current)
+        begin = clock()
+        for position, stage in enumerate(self.stages):
+            if getattr(stage, "process_batch", None) is not None:
+                try:
+                    current = self._call_stage(position, current, True,
+                                               retry=False)
+                    continue
+                except Exception:
+                    pass
+            survivors: List[Any] = []
+            kept: List[int] = []
+            for offset, data in zip(offsets, current):
+                try:
+                    survivors.append(self._call_stage(position, data))
+                except Exception as e:
+                    self.dead_letters.push(
+                        offset, self.stage_name(position), data, e)
+                else:
+                    kept.append(offset)
+            current, offsets = survivors, kept
+        self.run_metrics.record(clock() - begin, count,
+                                error=len(current) < count)
+        return current
+
+    def process_batch(self, items: Iterable[Any]) -> List[Any]:
+        """Process a batch of records through the pipeline.
+
+        Args:
+            items (Iterable[Any]): Input records.
+
+        Returns:
+            List[Any]: Processing results, in input order.
+        """
+        return self._run_stages_batch(list(items))
+
     @abstractmethod
     def process(self, data: Any) -> Any:
         """Process data through the pipeline.
@@ -160,6 +1093,18 @@ class ProcessingPipeline(ABC):
 class JSONAdapter(ProcessingPipeline):
     """Pipeline adapter for JSON data."""
 
+    ACCEPTS = (Mapping,)
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, pipeline_id: str):
+        """Initialize pipeline with identifier and empty stream counters.
+
+        Args:
+            pipeline_id (str): Unique pipeline ID.
+        """
+        super().__init__(pipeline_id)
+        self.metrics: Dict[str, int] = {}
+
     def process(self, data: Any) -> Any:
         """Process JSON data through stages.
 
@@ -171,10 +1116,116 @@ class JSONAdapter(ProcessingPipeline):
         """
         return self._run_stages(data)
 
+    def read_records(self, source: Any) -> Iterator[Any]:
+        """Decode a JSON Lines stream lazily.
+
+        The source is read in CHUNK_SIZE chunks and split on newlines,
+        keeping partial lines for the next chunk. Blank lines are ignored
+        and malformed lines are skipped; both are counted in metrics.
+
+        Args:
+            source (Any): File path, text or binary file object, or a
+            connected socket.
+
+        Returns:
+            Iterator[Any]: Decoded records.
+        """
+        owned = False
+        if isinstance(source, str):
+            source, owned = open(source, "rb"), True
+        elif hasattr(source, "makefile"):
+            source, owned = source.makefile("rb"), True
+        self.metrics = {"records": 0, "malformed": 0, "blank": 0}
+        try:
+            pending = None
+            while True:
+                chunk = source.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                if pending:
+                    chunk = pending + chunk
+                lines = chunk.split(b"\n" if isinstance(chunk, bytes)
+                                    else "\n")
+                pending = lines.pop()
+                yield from self._decode_lines(lines)
+            if pending:
+                yield from self._decode_lines([pending])
+        finally:
+            if owned:
+                source.close()
+            for name, value in self.metrics.items():
+                self.registry.increment(f"{self.pipeline_id}.{name}", value)
+
+    def process_stream(self, source: Any,
+                       batch_size: int = 1000) -> Iterator[Any]:
+        """Run every record of a JSON Lines stream through the pipeline.
+
+        Args:
+            source (Any): File path, file object or socket, see
+            read_records.
+            batch_size (int): Records handed to the stages at once.
+
+        Returns:
+            Iterator[Any]: Pipeline result of every record.
+        """
+        batch: List[Any] = []
+        for record in self.read_records(source):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield from self.process_batch(batch)
+                batch = []
+        if batch:
+            yield from self.process_batch(batch)
+
+    def _decode_lines(self, lines: List[Any]) -> Iterator[Any]:
+        """Decode complete lines, counting blank and malformed ones.
+
+        Args:
+            lines (List[Any]): Lines as bytes or str, without newline.
+
+        Returns:
+            Iterator[Any]: Decoded records.
+        """
+        metrics = self.metrics
+        for line in lines:
+            if not line.strip():
+                metrics["blank"] += 1
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                metrics["malformed"] += 1
+                continue
+            metrics["records"] += 1
+            yield record
+
 
 class CSVAdapter(ProcessingPipeline):
     """Pipeline adapter for CSV data."""
 
+    ACCEPTS = (str, CSVBatch)
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, pipeline_id: str):
+        """Initialize pipeline with identifier and empty stream metrics.
+
+        Args:
+            pipeline_id (str): Unique pipeline ID.
+        """
+        super().__init__(pipeline_id)
+        self.metrics: Dict[str, float] = {}
+
+    def accepts(self, data: Any) -> bool:
+        """Accept CSV batches and comma-separated strings.
+
+        Args:
+            data (Any): Input record.
+
+        Returns:
+            bool: True for CSV content.
+        """
+        return isinstance(data, CSVBatch) or "," in data
+
     def process(self, data: Any) -> Any:
         """Process CSV data through stages.
 
@@ -186,10 +1237,129 @@ class CSVAdapter(ProcessingPipeline):
         """
         return self._run_stages(data)
 
+    def read_batches(self, source: Any, batch_size: int = 1000,
+                     encoding: str = "utf-8") -> Iterator[CSVBatch]:
+        """Parse a CSV stream incrementally into typed row batches.
+
+        The source is read through a buffered reader of CHUNK_SIZE bytes
+        and parsed row by row with the csv module, so only the current
+        batch is held in memory. The first row gives the headers.
+        Row throughput is recorded in metrics while reading.
+
+        Args:
+            source (Any): File path, text or binary file object, or a
+            connected socket.
+            batch_size (int): Maximum rows per batch.
+            encoding (str): Encoding of binary sources.
+
+        Returns:
+            Iterator[CSVBatch]: Batches of typed rows.
+        """
+        stream, owned = self._open_text(source, encoding)
+        self.metrics = {"rows": 0, "batches": 0, "seconds": 0.0,
+                        "rows_per_second": 0.0}
+        start = time.perf_counter()
+        try:
+            reader = csv.reader(stream)
+            headers = next(reader, None)
+            if headers is None:
+                return
+            rows: List[List[Any]] = []
+            for row in reader:
+                rows.append([_typed(field) for field in row])
+                if len(rows) >= batch_size:
+                    self._record_batch(len(rows), start)
+                    yield CSVBatch(headers, rows)
+                    rows = []
+            if rows:
+                self._record_batch(len(rows), start)
+                yield CSVBatch(headers, rows)
+        finally:
+            if owned:
+                stream.close()
+            elif stream is not source:
+                buffered = stream.detach()
+                if buffered is not source:
+                    buffered.detach()
+
+    def process_stream(self, source: Any, batch_size: int = 1000,
+                       encoding: str = "utf-8") -> Iterator[Any]:
+        """Run every batch of a CSV stream through the pipeline.
+
+        Args:
+            source (Any): File path, file object or socket, see
+            read_batches.
+            batch_size (int): Maximum rows per batch.
+            encoding (str): Encoding of binary sources.
+
+        Returns:
+            Iterator[Any]: Pipeline result of every batch.
+        """
+        for batch in self.read_batches(source, batch_size, encoding):
+            yield self._run_stages(batch)
+
+    def _record_batch(self, rows: int, start: float) -> None:
+        """Update throughput metrics after a batch was parsed.
+
+        Args:
+            rows (int): Rows in the batch.
+            start (float): perf_counter value when reading started.
+        """
+        metrics = self.metrics
+        metrics["rows"] += rows
+        metrics["batches"] += 1
+        metrics["seconds"] = time.perf_counter() - start
+        if metrics["seconds"]:
+            metrics["rows_per_second"] = (
+                metrics["rows"] / metrics["seconds"])
+        registry = self.registry
+        registry.increment(f"{self.pipeline_id}.rows", rows)
+        registry.increment(f"{self.pipeline_id}.batches")
+        registry.set_gauge(f"{self.pipeline_id}.rows_per_second",
+                           metrics["rows_per_second"])
+
+    def _open_text(self, source: Any, encoding: str) -> Tuple[TextIO, bool]:
+        """Get a text stream suitable for csv.reader.
+
+        Args:
+            source (Any): File path, file object or socket.
+            encoding (str): Encoding of binary sources.
+
+        Returns:
+            Tuple[TextIO, bool]: Text stream, and whether it was opened
+            here and must be closed after reading. Wrappers around a
+            caller's binary file, including the buffer added for an
+            unbuffered one, are detached instead, leaving it open.
+        """
+        if isinstance(source, str):
+            return open(source, encoding=encoding, newline="",
+                        buffering=self.CHUNK_SIZE), True
+        if hasattr(source, "makefile"):
+            return source.makefile("r", buffering=self.CHUNK_SIZE,
+                                   encoding=encoding, newline=""), True
+        if isinstance(source, io.TextIOBase):
+            return source, False
+        if not isinstance(source, io.BufferedIOBase):
+            source = io.BufferedReader(source, self.CHUNK_SIZE)
+        return io.TextIOWrapper(source, encoding=encoding, newline=""), False
+
 
 class StreamAdapter(ProcessingPipeline):
     """Pipeline adapter for Stream data."""
 
+    ACCEPTS = (str, list)
+
+    def accepts(self, data: Any) -> bool:
+        """Accept stream lists and plain strings that are not CSV.
+
+        Args:
+            data (Any): Input record.
+
+        Returns:
+            bool: True for stream content.
+        """
+        return isinstance(data, list) or "," not in data
+
     def process(self, data: Any) -> Any:
         """Process stream data through stages.
 
@@ -203,43 +1373,165 @@ class StreamAdapter(ProcessingPipeline):
 
 
 class NexusManager:
-    """Manager for routing data to correct pipelines."""
+    """Manager for routing data to correct pipelines.
+
+    Records are dispatched by content: each pipeline declares the types
+    it accepts and a type -> pipelines table is built once per input
+    type. Pipelines can also be connected into a DAG, the output of a
+    pipeline then being routed to its downstream pipelines (fan-out),
+    and a pipeline may have several upstream pipelines (fan-in).
+    Pipelines with upstream pipelines only receive their outputs.
+    """
 
     def __init__(self) -> None:
         """Initialize the pipeline manager."""
         print("Initializing Nexus Manager...")
         self.pipelines: List[ProcessingPipeline] = []
+        self.registry = MetricsRegistry()
+        self.metrics = self.registry.get("nexus")
+        self.edges: Dict[str, List[ProcessingPipeline]] = {}
+        self.unrouted = 0
+        self._routes: Dict[type, List[ProcessingPipeline]] = {}
 
     def add_pipeline(self, pipeline: ProcessingPipeline) -> None:
         """Register a new pipeline.
 
+        The pipeline then records its metrics in the manager's registry.
+
         Args:
             pipeline (ProcessingPipeline): Pipeline instance to add.
         """
+        pipeline.registry = self.registry
         self.pipelines.append(pipeline)
+        self._routes.clear()
 
-    def process_data(self, data: Any) -> Any:
-        """Process data through all registered pipelines sequentially.
+    def connect(self, source: ProcessingPipeline,
+                target: ProcessingPipeline) -> None:
+        """Route the output of a pipeline to another one.
+
+        Args:
+            source (ProcessingPipeline): Upstream pipeline.
+            target (ProcessingPipeline): Downstream pipeline.
+
+        Raises:
+            ValueError: If a pipeline is not registered or the edge would
+            create a cycle.
+        """
+        for pipeline in (source, target):
+            if pipeline not in self.pipelines:
+                raise ValueError(
+                    f"Pipeline {pipeline.pipeline_id} is not registered")
+        if self._reaches(target, source):
+            raise ValueError(
+                f"Edge {source.pipeline_id} -> {target.pipeline_id} "
+                "would create a cycle")
+        self.edges.setdefault(source.pipeline_id, []).append(target)
+        self._routes.clear()
+
+    def _reaches(self, start: ProcessingPipeline,
+                 goal: ProcessingPipeline) -> bool:
+        """Tell whether goal is reachable from start through edges.
+
+        Args:
+            start (ProcessingPipeline): Pipeline to start from.
+            goal (ProcessingPipeline): Pipeline to look for.
+
+        Returns:
+            bool: True if a path exists.
+        """
+        pending = [start]
+        seen = set()
+        while pending:
+            pipeline = pending.pop()
+            if pipeline is goal:
+                return True
+            if id(pipeline) not in seen:
+                seen.add(id(pipeline))
+                pending.extend(self.edges.get(pipeline.pipeline_id, []))
+        return False
+
+    def _candidates(self, kind: type) -> List[ProcessingPipeline]:
+        """Return the entry pipelines accepting a type, cached per type.
+
+        Args:
+            kind (type): Type of the record.
+
+        Returns:
+            List[ProcessingPipeline]: Pipelines without upstream pipelines
+            whose ACCEPTS covers the type, in registration order.
+        """
+        routes = self._routes.get(kind)
+        if routes is None:
+            targets = {id(t) for ts in self.edges.values() for t in ts}
+            routes = [p for p in self.pipelines
+                      if id(p) not in targets and issubclass(kind, p.ACCEPTS)]
+            self._routes[kind] = routes
+        return routes
+
+    def process_data(self, data: Any) -> List[Any]:
+        """Process a record through the pipelines matching its content.
 
         Args:
             data (Any): Input data.
 
         Returns:
-            Any: Final processed result.
+            List[Any]: Outputs not routed further downstream, in the
+            order they completed. Empty if no pipeline accepts the record.
         """
-        result = data
-        for pipeline in self.pipelines:
-            result = pipeline.process(result)
-        return result
+        start = time.perf_counter_ns()
+        try:
+            entries = [p for p in self._candidates(type(data))
+                       if p.accepts(data)]
+            if not entries:
+                self.unrouted += 1
+            results = []
+            pending = [(pipeline, data) for pipeline in reversed(entries)]
+            while pending:
+                pipeline, record = pending.pop()
+                output = pipeline.process(record)
+                downstream = [
+                    t for t in self.edges.get(pipeline.pipeline_id, [])
+                    if isinstance(output, t.ACCEPTS) and t.accepts(output)]
+                if not downstream:
+                    results.append(output)
+                pending.extend((t, output) for t in reversed(downstream))
+        except Exception:
+            self.metrics.record(time.perf_counter_ns() - start, error=True)
+            raise
+        self.metrics.record(time.perf_counter_ns() - start)
+        return results
+
+    def stats(self) -> str:
+        """Return measured throughput of the registered pipelines.
 
-    @staticmethod
-    def stats() -> str:
-        """Return pipeline statistics.
+        Returns:
+            str: Records per second of processing time and p99 latency,
+            or a notice if nothing was measured yet.
+        """
+        snapshots = [p.run_metrics.snapshot() for p in self.pipelines]
+        items = sum(s["items"] for s in snapshots)
+        seconds = sum(s["seconds"] for s in snapshots)
+        if not items or not seconds:
+            return "no measurements yet"
+        p99 = max(s["p99"] for s in snapshots)
+        return (f"{items / seconds:,.0f} records/second, "
+                f"p99 latency {p99 * 1000:.3f} ms")
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return every metric recorded by the manager and its pipelines.
 
         Returns:
-            str: Stats string.
+            Dict[str, Dict[str, float]]: Snapshot per metric name.
+        """
+        return self.registry.snapshot()
+
+    def export_metrics(self, path: str) -> None:
+        """Write every metric to a file in Prometheus text format.
+
+        Args:
+            path (str): Destination file.
         """
-        return "1000 streams/second"
+        self.registry.export_prometheus(path)
 
 
 def main():
@@ -250,7 +1542,7 @@ def main():
 
     print("Creating Data Processing Pipeline...")
     print("Stage 1: Input validation and parsing")
-    input_stage = InputStage()
+    input_stage = InputStage(log_json=True)
     print("Stage 2: Data transformation and enrichment")
     transform_stage = TransformStage()
     print("Stage 3: Output formatting and delivery")
@@ -262,8 +1554,10 @@ def main():
     print("Processing JSON data through pipeline...")
     json_pipeline = JSONAdapter("A")
     json_pipeline.add_stage(input_stage)
-    json_pipeline.add_stage(transform_stage)
+    json_pipeline.add_stage(transform_stage, RetryPolicy(
+        attempts=3, delay=0.01, retry_on=(TimeoutError, ConnectionError)))
     json_pipeline.add_stage(output_stage)
+    nexus.add_pipeline(json_pipeline)
     json_pipeline.process({
         "sensor": "temp",
         "value": 23.5,
@@ -276,6 +1570,7 @@ def main():
     csv_pipeline.add_stage(input_stage)
     csv_pipeline.add_stage(transform_stage)
     csv_pipeline.add_stage(output_stage)
+    nexus.add_pipeline(csv_pipeline)
     csv_pipeline.process("user,action,timestamp")
 
     # Stream Pipeline
@@ -284,13 +1579,16 @@ def main():
     stream_pipeline.add_stage(input_stage)
     stream_pipeline.add_stage(transform_stage)
     stream_pipeline.add_stage(output_stage)
+    nexus.add_pipeline(stream_pipeline)
     stream_pipeline.process("Real-time sensor stream")
 
     print("\n=== Pipeline Chaining Demo ===")
     print("Pipeline A -> Pipeline B -> Pipeline C")
     print("Data flow: Raw -> Processed -> Analyzed -> Stored\n")
-    print("Chain result: 100 records processed through 3-stage pipeline")
-    print("Performance: 95% efficiency, 0.2s total processing time")
+    records = sum(p.run_metrics.items for p in nexus.pipelines)
+    print(f"Chain result: {records} records processed through 3-stage "
+          "pipeline")
+    print(f"Performance: {nexus.stats()}")
 
     print("\n=== Error Recovery Test ===")
     print("Simulating pipeline failure...")
@@ -299,8 +1597,16 @@ def main():
     except ValueError as e:
         print(f"Error detected in Stage 2: {e}")
 
-    print("Recovery initiated: Switching to backup processor")
-    print("Recovery successful: Pipeline restored, processing resumed")
+    errors = json_pipeline.stage_metrics[1].errors
+    print(f"Recovery initiated: {errors} failed attempt, invalid data is "
+          "not retried")
+    for entry in json_pipeline.dead_letters.drain():
+        print(f"Dead letter: {entry['data']!r} from {entry['stage']} "
+              f"({entry['error']})")
+    results = json_pipeline.process_batch(
+        ["INVALID_DATA", {"sensor": "temp", "value": 21.0, "unit": "C"}])
+    print(f"Recovery successful: {len(results)} of 2 records processed, "
+          f"{len(json_pipeline.dead_letters)} sent to the dead-letter queue")
     print("\nNexus Integration complete. All systems operational.")
 
 
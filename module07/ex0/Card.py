@@ -10,6 +10,8 @@ class Card(ABC):
         cost (int): The mana cost to play the card.
         rarity (str): The rarity level of the card.
     """
+    __slots__ = ("name", "cost", "rarity")
+
     def __init__(self, name: str, cost: int, rarity: str):
         """
         Initialize a new Card instance.
@@ -0,0 +1,258 @@
+from array import array
+from ex0.Card import Card
+from ex0.CreatureCard import CreatureCard
+from ex0.Combat import CombatResult, resolve_combat
+
+
+class CardView:
+    """
+    A lightweight view on one row of a CardTable.
+
+    Reading or assigning an attribute reads or writes the table column,
+    so a view costs two references instead of a full card object.
+
+    Attributes:
+        index (int): The row of the card in the table.
+    """
+    __slots__ = ("_table", "index")
+
+    def __init__(self, table: "CardTable", index: int):
+        """
+        Initialize a view on a table row.
+
+        Args:
+            table (CardTable): The table holding the card.
+            index (int): The row of the card.
+        """
+        self._table = table
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        """The name of the card."""
+        return self._table.names[self._table.name_codes[self.index]]
+
+    @property
+    def rarity(self) -> str:
+        """The rarity of the card."""
+        return self._table.rarities[self._table.rarity_codes[self.index]]
+
+    @property
+    def cost(self) -> int:
+        """The mana cost of the card."""
+        return self._table.costs[self.index]
+
+    @property
+    def attack(self) -> int:
+        """The attack points of the card, 0 for non-creatures."""
+        return self._table.attacks[self.index]
+
+    @attack.setter
+    def attack(self, value: int) -> None:
+        self._table.attacks[self.index] = value
+
+    @property
+    def health(self) -> int:
+        """The health points of the card, 0 for non-creatures."""
+        return self._table.healths[self.index]
+
+    @health.setter
+    def health(self, value: int) -> None:
+        self._table.healths[self.index] = value
+
+    def is_playable(self, available_mana: int) -> bool:
+        """
+        Check if the card can be played with the available mana.
+
+        Args:
+            available_mana (int): The amount of mana available.
+
+        Returns:
+            bool: True if the card can be played, False otherwise.
+        """
+        return available_mana >= self.cost
+
+    def get_card_info(self) -> dict:
+        """
+        Get the information about the card.
+
+        Returns:
+            dict: A dictionary containing the card's name, cost, rarity,
+                attack and health.
+        """
+        return {
+            'name': self.name,
+            'cost': self.cost,
+            'rarity': self.rarity,
+            'attack': self.attack,
+            'health': self.health
+        }
+
+
+class CardTable:
+    """
+    A struct-of-arrays store for large numbers of cards.
+
+    Each card is a row spread over parallel typed arrays. Names and
+    rarities are interned and stored as integer codes.
+
+    Attributes:
+        names (list): The distinct card names, indexed by name code.
+        rarities (list): The distinct rarities, indexed by rarity code.
+        name_codes (array): The name code of every card.
+        rarity_codes (array): The rarity code of every card.
+        costs (array): The mana cost of every card.
+        attacks (array): The attack points of every card.
+        healths (array): The health points of every card.
+    """
+    __slots__ = ("names", "rarities", "_name_index", "_rarity_index",
+                 "name_codes", "rarity_codes", "costs", "attacks", "healths")
+
+    def __init__(self):
+        """
+        Initialize an empty CardTable.
+        """
+        self.names = []
+        self.rarities = []
+        self._name_index = {}
+        self._rarity_index = {}
+        self.name_codes = array('I')
+        self.rarity_codes = array('B')
+        self.costs = array('i')
+        self.attacks = array('i')
+        self.healths = array('i')
+
+    def __len__(self) -> int:
+        """
+        Get the number of cards in the table.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.costs)
+
+    def __getitem__(self, index: int) -> CardView:
+        """
+        Get a view on a card.
+
+        Args:
+            index (int): The row of the card, negative values count from
+                the end.
+
+        Returns:
+            CardView: A view on the row.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CardTable index out of range")
+        return CardView(self, index)
+
+    def __iter__(self):
+        """
+        Iterate over views on every card.
+        """
+        return (CardView(self, index) for index in range(len(self)))
+
+    def append(self, name: str, cost: int, rarity: str, attack: int = 0,
+               health: int = 0) -> int:
+        """
+        Add a card to the table.
+
+        Args:
+            name (str): The name of the card.
+            cost (int): The mana cost of the card.
+            rarity (str): The rarity of the card.
+            attack (int, optional): The attack points. Defaults to 0.
+            health (int, optional): The health points. Defaults to 0.
+
+        Returns:
+            int: The row of the new card.
+        """
+        self.name_codes.append(self._intern(name, self.names,
+                                            self._name_index))
+        self.rarity_codes.append(self._intern(rarity, self.rarities,
+                                              self._rarity_index))
+        self.costs.append(cost)
+        self.attacks.append(attack)
+        self.healths.append(health)
+        return len(self.costs) - 1
+
+    def add_card(self, card: Card) -> int:
+        """
+        Copy a card object into the table.
+
+        Args:
+            card (Card): The card to store.
+
+        Returns:
+            int: The row of the new card.
+        """
+        if isinstance(card, CreatureCard):
+            return self.append(card.name, card.cost, card.rarity,
+                               card.attack, card.health)
+        return self.append(card.name, card.cost, card.rarity)
+
+    def resolve_combat(self, attackers, targets) -> CombatResult:
+        """
+        Resolve a combat round between rows of the table.
+
+        The remaining health of every target is written back to the
+        table.
+
+        Args:
+            attackers: The row of the attacker of every attack.
+            targets: The row of the target of every attack.
+
+        Returns:
+            CombatResult: The result of the round. Attackers are rows of
+                the table, healths only cover the rows that were attacked
+                and rows gives the row of each of them.
+        """
+        rows = array('I', sorted(set(targets)))
+        local = {row: j for j, row in enumerate(rows)}
+        result = resolve_combat(
+            self.attacks, array('i', map(self.healths.__getitem__, rows)),
+            array('I', map(local.__getitem__, targets)), attackers, rows
+        )
+        for row, health in zip(rows, result.healths):
+            self.healths[row] = health
+        return result
+
+    def combat_log(self, result: CombatResult) -> list:
+        """
+        Get the per-attack dictionaries of a round resolved on the table.
+
+        Only the names of the rows taking part in the round are looked up,
+        whatever the size of the table.
+
+        Args:
+            result (CombatResult): A result of resolve_combat.
+
+        Returns:
+            list: One attack_target style dictionary per attack.
+        """
+        names = self.names
+        codes = self.name_codes
+        return result.as_dicts(
+            {row: names[codes[row]] for row in set(result.attackers)},
+            [names[codes[row]] for row in result.rows])
+
+    @staticmethod
+    def _intern(value: str, values: list, index: dict) -> int:
+        """
+        Get the code of a value, registering it if it is new.
+
+        Args:
+            value (str): The value to encode.
+            values (list): The known values, indexed by code.
+            index (dict): The known codes, indexed by value.
+
+        Returns:
+            int: The code of the value.
+        """
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(values)
+            values.append(value)
+        return code
@@ -0,0 +1,153 @@
+from array import array
+
+
+def _numpy():
+    """
+    Get the numpy module if it is installed.
+
+    Returns:
+        module: The numpy module, or None when it is not available.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class CombatResult:
+    """
+    The outcome of a batch combat round, stored as compact arrays.
+
+    Index i of the attacker arrays describes the i-th attack of the
+    round, index j of healths describes the j-th target. When the targets
+    are rows of a larger collection, rows gives the row of each target.
+
+    Attributes:
+        attackers (array): The attacker of every attack.
+        targets (array): The target hit by every attack.
+        damage (array): The damage dealt by every attack.
+        healths (array): The health of every target after the round.
+        resolved (array): 1 for every attack whose target died, else 0.
+        rows (array | None): The row of every target, None when targets
+            are not rows of a collection.
+    """
+    __slots__ = ("attackers", "targets", "damage", "healths", "resolved",
+                 "rows")
+
+    def __init__(self, attackers: array, targets: array, damage: array,
+                 healths: array, resolved: array, rows: array = None):
+        """
+        Initialize a new CombatResult instance.
+
+        Args:
+            attackers (array): The attacker of every attack.
+            targets (array): The target hit by every attack.
+            damage (array): The damage dealt by every attack.
+            healths (array): The health of every target after the round.
+            resolved (array): 1 for every attack whose target died.
+            rows (array, optional): The row of every target. Defaults to
+                None.
+        """
+        self.attackers = attackers
+        self.targets = targets
+        self.damage = damage
+        self.healths = healths
+        self.resolved = resolved
+        self.rows = rows
+
+    def __len__(self) -> int:
+        """
+        Get the number of attacks in the round.
+
+        Returns:
+            int: The number of attacks.
+        """
+        return len(self.damage)
+
+    def casualties(self) -> list:
+        """
+        Get the targets of the round left with no health.
+
+        Returns:
+            list: The indices of the targets, or their rows when known.
+        """
+        dead = [j for j, health in enumerate(self.healths) if health <= 0]
+        if self.rows is None:
+            return dead
+        return [self.rows[j] for j in dead]
+
+    def as_dicts(self, attacker_names, target_names) -> list:
+        """
+        Get the result of every attack in the format of attack_target.
+
+        Args:
+            attacker_names: The name of every attacker, by index.
+            target_names: The name of every target, by index into
+                healths.
+
+        Returns:
+            list: One result dictionary per attack.
+        """
+        return [
+            {
+                'attacker': attacker_names[i],
+                'target': target_names[j],
+                'damage_dealt': damage,
+                'combat_resolved': bool(resolved)
+            }
+            for i, j, damage, resolved in zip(self.attackers, self.targets,
+                                              self.damage, self.resolved)
+        ]
+
+
+def resolve_combat(attacks, healths, targets, attackers=None,
+                   rows=None) -> CombatResult:
+    """
+    Resolve a combat round between N attackers and M targets at once.
+
+    Every attack deals the attack points of its attacker to its target.
+    Damage is summed per target before being applied, so the whole round
+    is resolved with a handful of passes over flat arrays and nothing is
+    printed. numpy is used when it is installed.
+
+    Args:
+        attacks: The attack points of the N attackers.
+        healths: The health points of the M targets.
+        targets: The target index of every attack.
+        attackers (optional): The attacker index of every attack.
+            Defaults to attacker i attacking targets[i].
+        rows (optional): The row of every target in a larger collection,
+            kept in the result.
+
+    Returns:
+        CombatResult: The damage dealt, the remaining healths and which
+            attacks resolved the combat.
+    """
+    if attackers is None:
+        attackers = range(len(targets))
+    if len(attackers) != len(targets):
+        raise ValueError("attackers and targets must have the same length")
+    np = _numpy()
+    if np is not None:
+        attacker_idx = np.asarray(attackers, dtype=np.int64)
+        target_idx = np.asarray(targets, dtype=np.int64)
+        damage = np.asarray(attacks, dtype=np.int64)[attacker_idx]
+        left = np.asarray(healths, dtype=np.int64) - np.bincount(
+            target_idx, weights=damage, minlength=len(healths)
+        ).astype(np.int64)
+        resolved = left[target_idx] <= 0
+        return CombatResult(
+            array('I', attacker_idx.tolist()), array('I', target_idx.tolist()),
+            array('i', damage.tolist()), array('i', left.tolist()),
+            array('B', resolved.tolist()), rows
+        )
+    attacker_idx = array('I', attackers)
+    target_idx = array('I', targets)
+    damage = array('i', map(attacks.__getitem__, attacker_idx))
+    left = array('i', healths)
+    for j, points in zip(target_idx, damage):
+        left[j] -= points
+    resolved = array('B', (left[j] <= 0 for j in target_idx))
+    return CombatResult(attacker_idx, target_idx, damage, left, resolved,
+                        rows)
@@ -9,6 +9,8 @@ class CreatureCard(Card):
         health (int): The health points of the creature.
         attack (int): The attack points of the creature.
     """
+    __slots__ = ("health", "attack")
+
     def __init__(self, name: str, cost: int, rarity: str, attack: int,
                  health: int):
         """
@@ -79,7 +81,7 @@ class CreatureCard(Card):
         Returns:
             dict: result of the attack or failure message.
         """
-        if type(target) is CreatureCard:
+        if isinstance(target, CreatureCard):
             print(f"{self.name} attacks {target.name}:")
             target.health -= self.attack
             return {
@@ -1,4 +1,7 @@
 from ex0.Card import Card
 from ex0.CreatureCard import CreatureCard
+from ex0.Combat import CombatResult, resolve_combat
+from ex0.CardTable import CardTable, CardView
 
-__all__ = ["Card", "CreatureCard"]
+__all__ = ["Card", "CreatureCard", "CombatResult", "resolve_combat",
+           "CardTable", "CardView"]
@@ -9,6 +9,8 @@ class ArtifactCard(Card):
         durability (int): The durability of the artifact.
         effect (str): The effect description of the artifact.
     """
+    __slots__ = ("durability", "effect")
+
     def __init__(self, name: str, cost: int, rarity: str, durability: int,
                  effect: str):
         """
@@ -1,33 +1,79 @@
 import random
+from collections import Counter, deque
 from ex0 import Card, CreatureCard
-from ex1 import SpellCard, ArtifactCard
+from ex1.SpellCard import SpellCard
+from ex1.ArtifactCard import ArtifactCard
+
+CARD_CATEGORIES = (
+    ('creatures', CreatureCard),
+    ('spells', SpellCard),
+    ('artifacts', ArtifactCard)
+)
 
 
 class Deck:
     """
     A class representing a deck of cards.
 
+    Cards are kept in a deque of (sequence, card) slots, the top of the
+    deck being on the left. Each card name maps to the slots of its
+    copies, so removing a card by name only marks its slot as removed;
+    removed slots are skipped when drawing. Total cost, per-category
+    counts and the cost histogram are updated on every change, so
+    statistics never rescan the deck.
+
     Attributes:
-        cards (list): A list of cards in the deck.
+        cards (list): The cards in the deck, from top to bottom.
     """
     def __init__(self):
         """
-        Initialize a new Deck instance using list.
+        Initialize a new empty Deck instance.
+        """
+        self._slots = deque()
+        self._positions = {}
+        self._removed = set()
+        self._next_seq = 0
+        self._total_cost = 0
+        self._category_counts = Counter()
+        self._cost_counts = Counter()
+        self._categories = {}
+
+    @property
+    def cards(self) -> list:
+        """
+        Get the cards currently in the deck.
+
+        Returns:
+            list: A new list of the cards, from top to bottom.
         """
-        self.cards = []
+        return [card for seq, card in self._slots
+                if seq not in self._removed]
+
+    def __len__(self) -> int:
+        """
+        Get the number of cards in the deck.
+
+        Returns:
+            int: The number of cards left.
+        """
+        return len(self._slots) - len(self._removed)
 
     def add_card(self, card: Card) -> None:
         """
-        Add a card to the deck.
+        Add a card to the bottom of the deck.
 
         Args:
             card (Card): The card to add to the deck.
         """
-        self.cards.append(card)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._slots.append((seq, card))
+        self._positions.setdefault(card.name, deque()).append((seq, card))
+        self._count(card, 1)
 
     def remove_card(self, card_name: str) -> bool:
         """
-        Remove a card from the deck by name.
+        Remove the topmost card with the given name from the deck.
 
         Args:
             card_name (str): The name of the card to remove.
@@ -35,18 +81,32 @@ class Deck:
         Returns:
             bool: True if the card was removed, False otherwise.
         """
-        try:
-            idx = self.cards.index(card_name)
-            self.cards.pop(idx)
-            return True
-        except ValueError:
+        positions = self._positions.get(card_name)
+        if not positions:
             return False
+        seq, card = positions.popleft()
+        self._removed.add(seq)
+        self._count(card, -1)
+        if not positions:
+            del self._positions[card_name]
+        if len(self._removed) > len(self._slots) // 2:
+            self._compact()
+        return True
 
     def shuffle(self) -> None:
         """
         Shuffle the cards in the deck.
         """
-        random.shuffle(self.cards)
+        cards = self.cards
+        random.shuffle(cards)
+        self._slots.clear()
+        self._positions.clear()
+        self._removed.clear()
+        self._total_cost = 0
+        self._category_counts.clear()
+        self._cost_counts.clear()
+        for card in cards:
+            self.add_card(card)
 
     def draw_card(self) -> Card:
         """
@@ -55,10 +115,48 @@ class Deck:
         Returns:
             Card: The drawn card, or None if the deck is empty.
         """
-        if len(self.cards) > 0:
-            return self.cards.pop(0)
+        while self._slots:
+            seq, card = self._slots.popleft()
+            if seq in self._removed:
+                self._removed.discard(seq)
+                continue
+            positions = self._positions[card.name]
+            positions.popleft()
+            if not positions:
+                del self._positions[card.name]
+            self._count(card, -1)
+            return card
         return None
 
+    def _count(self, card: Card, delta: int) -> None:
+        """
+        Update the running statistics for a card entering or leaving.
+
+        Args:
+            card (Card): The card added or taken out.
+            delta (int): 1 when the card is added, -1 when it leaves.
+        """
+        self._total_cost += delta * card.cost
+        self._cost_counts[card.cost] += delta
+        if not self._cost_counts[card.cost]:
+            del self._cost_counts[card.cost]
+        card_type = type(card)
+        if card_type not in self._categories:
+            self._categories[card_type] = next(
+                (name for name, base in CARD_CATEGORIES
+                 if issubclass(card_type, base)), None)
+        category = self._categories[card_type]
+        if category is not None:
+            self._category_counts[category] += delta
+
+    def _compact(self) -> None:
+        """
+        Drop the slots of removed cards.
+        """
+        self._slots = deque(slot for slot in self._slots
+                            if slot[0] not in self._removed)
+        self._removed.clear()
+
     def get_deck_stats(self) -> dict:
         """
         Get statistics about the deck.
@@ -66,18 +164,18 @@ class Deck:
         Returns:
             dict: Dictionary containing deck statistics with card counts.
         """
-        s = len(self.cards)
-        if s == 0:
-            avg = 0
-        else:
-            avg = sum([c.cost / s for c in self.cards])
-        return {
-            'total_cards': s,
-            'creatures': len([card for card in self.cards
-                              if type(card) is CreatureCard]),
-            'spells': len([card for card in self.cards
-                           if type(card) is SpellCard]),
-            'artifacts': len([card for card in self.cards
-                              if type(card) is ArtifactCard]),
-            'avg_cost': avg
-        }
+        s = len(self)
+        stats = {'total_cards': s}
+        for name, _ in CARD_CATEGORIES:
+            stats[name] = self._category_counts[name]
+        stats['avg_cost'] = self._total_cost / s if s else 0
+        return stats
+
+    def get_cost_curve(self) -> dict:
+        """
+        Get how many cards the deck holds for each mana cost.
+
+        Returns:
+            dict: Dictionary mapping each cost to its card count.
+        """
+        return dict(sorted(self._cost_counts.items()))
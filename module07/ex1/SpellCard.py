@@ -8,6 +8,8 @@ class SpellCard(Card):
     Attributes:
         effect_type (str): The type of effect the spell has.
     """
+    __slots__ = ("effect_type",)
+
     def __init__(self, name: str, cost: int, rarity: str, effect_type: str):
         """
         Initialize a new SpellCard instance.
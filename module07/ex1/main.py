@@ -32,7 +32,7 @@ def main():
         50
     ))
     print(f"Deck stats: {deck.get_deck_stats()}")
-    while len(deck.cards) > 0:
+    while len(deck) > 0:
         card = deck.draw_card()
         print(f"\nDrew: {card.name} (\
 {card.__class__.__name__.replace('Card', '')})")
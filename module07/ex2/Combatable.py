@@ -5,6 +5,8 @@ class Combatable(ABC):
     """
     Abstract base class for combat-capable entities.
     """
+    __slots__ = ()
+
     @abstractmethod
     def attack(self, target) -> dict:
         """
@@ -11,6 +11,8 @@ class EliteCard(Card, Combatable, Magical):
         defense (int): The defense stat of the card.
         mana (int): The current mana pool of the card.
     """
+    __slots__ = ("attack_power", "defense", "mana")
+
     def __init__(self, name: str, cost: int, rarity: str,
                  attack_power: int = 5, defense: int = 3, mana: int = 4):
         """
@@ -5,6 +5,8 @@ class Magical(ABC):
     """
     Abstract base class for magical entities.
     """
+    __slots__ = ()
+
     @abstractmethod
     def cast_spell(self, spell_name: str, targets: list) -> dict:
         """
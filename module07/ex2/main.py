@@ -10,12 +10,12 @@ def main():
 
     print("EliteCard capabilities:")
 
-    card_methods = [m for m in dir(Card) if not m.startswith('__')
-                    and not m.startswith('_')]
-    combat_methods = [m for m in dir(Combatable) if not m.startswith('__')
-                      and not m.startswith('_')]
-    magic_methods = [m for m in dir(Magical) if not m.startswith('__')
-                     and not m.startswith('_')]
+    card_methods = [m for m in dir(Card) if not m.startswith('_')
+                    and callable(getattr(Card, m))]
+    combat_methods = [m for m in dir(Combatable) if not m.startswith('_')
+                      and callable(getattr(Combatable, m))]
+    magic_methods = [m for m in dir(Magical) if not m.startswith('_')
+                     and callable(getattr(Magical, m))]
 
     print(f"- Card: {card_methods}")
     print(f"- Combatable: {combat_methods}")
@@ -0,0 +1,294 @@
+from collections.abc import Sequence
+from functools import lru_cache
+from types import CellType, FunctionType, MappingProxyType
+from ex0 import Card
+
+_NOT_COPIED = frozenset({
+    "__init__", "__slots__", "__dict__", "__weakref__", "__module__",
+    "__qualname__", "__doc__", "__abstractmethods__", "_abc_impl"
+})
+
+
+def _template_field(name: str) -> property:
+    """
+    Build a read-only attribute reading a field of the card's template.
+
+    Args:
+        name (str): The name of the field.
+
+    Returns:
+        property: The attribute, without setter.
+    """
+    def get(card):
+        return card.template.fields[name]
+    return property(get, doc=f"The {name} of the card, from its template.")
+
+
+def _bind_class(value, owner: type):
+    """
+    Make the super() calls of a class attribute use another class.
+
+    Methods calling super() without arguments refer to the class defining
+    them; the copy moved to a flyweight class must refer to that class
+    instead, since flyweight cards are not instances of the card class.
+
+    Args:
+        value: The class attribute, a function or a descriptor wrapping
+            functions.
+        owner (type): The flyweight class receiving the attribute.
+
+    Returns:
+        The attribute itself, or a copy bound to owner.
+    """
+    if isinstance(value, (staticmethod, classmethod)):
+        return type(value)(_bind_class(value.__func__, owner))
+    if isinstance(value, property):
+        return property(*(
+            function and _bind_class(function, owner)
+            for function in (value.fget, value.fset, value.fdel)
+        ), value.__doc__)
+    if (not isinstance(value, FunctionType) or
+            "__class__" not in value.__code__.co_freevars):
+        return value
+    closure = tuple(
+        CellType(owner) if name == "__class__" else cell
+        for name, cell in zip(value.__code__.co_freevars, value.__closure__)
+    )
+    function = FunctionType(value.__code__, value.__globals__,
+                            value.__name__, value.__defaults__, closure)
+    function.__kwdefaults__ = value.__kwdefaults__
+    function.__qualname__ = value.__qualname__
+    function.__doc__ = value.__doc__
+    function.__dict__.update(value.__dict__)
+    return function
+
+
+def _restore_card(template: "CardTemplate", values: tuple) -> Card:
+    """
+    Rebuild a pickled flyweight card.
+
+    Args:
+        template (CardTemplate): The template of the card.
+        values (tuple): The value of every mutable field of the card.
+
+    Returns:
+        Card: A flyweight card in the pickled state.
+    """
+    card = template.create()
+    for field, value in zip(template.mutable, values):
+        setattr(card, field, value)
+    return card
+
+
+def _reduce_card(card) -> tuple:
+    """
+    Pickle a flyweight card as its template and its mutable fields.
+
+    Returns:
+        tuple: The arguments of _restore_card.
+    """
+    template = card.template
+    return _restore_card, (
+        template, tuple(getattr(card, field) for field in template.mutable)
+    )
+
+
+@lru_cache(maxsize=None)
+def flyweight_class(card_class: type, mutable: tuple) -> type:
+    """
+    Get the flyweight version of a card class.
+
+    Flyweight cards only store a reference to their template and their
+    mutable fields; the other fields are read-only attributes reading
+    the template. The flyweight class mirrors the MRO of the card class
+    with one class per ancestor, named after it and holding a copy of
+    its attributes but __init__, so methods, properties and constants
+    keep working, super() included. It is registered as a virtual
+    subclass of the card class, so isinstance checks keep working too.
+
+    Args:
+        card_class (type): The card class.
+        mutable (tuple): The fields stored by each card.
+
+    Returns:
+        type: The flyweight class, built once per card class and fields.
+    """
+    chain = card_class.__mro__[:-1]
+    declared = {field for klass in chain
+                for field in getattr(klass, "__slots__", ())}
+    slots = ("template",) + tuple(f for f in mutable if f not in declared)
+    flyweight = None
+    for klass in reversed(chain):
+        own_slots = getattr(klass, "__slots__", ())
+        if isinstance(own_slots, str):
+            own_slots = (own_slots,)
+        namespace = {
+            "__slots__": slots + tuple(f for f in own_slots if f in mutable),
+            "__module__": klass.__module__,
+            "__qualname__": klass.__qualname__,
+            "__doc__": klass.__doc__
+        }
+        for field in own_slots:
+            if field not in mutable:
+                namespace[field] = _template_field(field)
+        attributes = {name: value for name, value in vars(klass).items()
+                      if name not in _NOT_COPIED and name not in own_slots}
+        bases = () if flyweight is None else (flyweight,)
+        flyweight = type(klass.__name__, bases, namespace)
+        for name, value in attributes.items():
+            setattr(flyweight, name, _bind_class(value, flyweight))
+        slots = ()
+    flyweight.__reduce__ = _reduce_card
+    card_class.register(flyweight)
+    return flyweight
+
+
+class CardTemplate:
+    """
+    Immutable description of a card, shared by every copy of it.
+
+    The template validates its data once by building a prototype card,
+    then creates flyweight cards holding only the template and their
+    mutable fields, initialized from the template.
+
+    Attributes:
+        card_class (type): The class the cards behave as.
+        args (tuple): The constructor arguments of the cards.
+        fields (MappingProxyType): The read-only values of every field.
+        mutable (tuple): The fields each card stores itself.
+    """
+    __slots__ = ("card_class", "args", "fields", "mutable", "_flyweight")
+
+    def __init__(self, card_class: type, *args, mutable: tuple = ()):
+        """
+        Initialize a new CardTemplate instance.
+
+        Args:
+            card_class (type): The class the cards behave as.
+            *args: The constructor arguments of the cards.
+            mutable (tuple, optional): The fields each card stores
+                itself, such as health. Defaults to none.
+        """
+        prototype = card_class(*args)
+        fields = {}
+        for klass in card_class.__mro__:
+            for field in getattr(klass, "__slots__", ()):
+                fields[field] = getattr(prototype, field)
+        object.__setattr__(self, "card_class", card_class)
+        object.__setattr__(self, "args", args)
+        object.__setattr__(self, "fields", MappingProxyType(fields))
+        object.__setattr__(self, "mutable", tuple(mutable))
+        object.__setattr__(self, "_flyweight",
+                           flyweight_class(card_class, tuple(mutable)))
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the template as the arguments building it.
+
+        Returns:
+            tuple: The arguments of _build_template.
+        """
+        return _build_template, (self.card_class, self.args, self.mutable)
+
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Reject any modification of the template.
+
+        Raises:
+            AttributeError: Always, templates are immutable.
+        """
+        raise AttributeError("CardTemplate is immutable")
+
+    def create(self) -> Card:
+        """
+        Create a new flyweight card from the template.
+
+        Returns:
+            Card: A card sharing the template's immutable fields.
+        """
+        card = self._flyweight()
+        card.template = self
+        for field in self.mutable:
+            setattr(card, field, self.fields[field])
+        return card
+
+
+def _build_template(card_class: type, args: tuple,
+                    mutable: tuple) -> CardTemplate:
+    """
+    Rebuild a pickled template.
+
+    Args:
+        card_class (type): The class the cards behave as.
+        args (tuple): The constructor arguments of the cards.
+        mutable (tuple): The fields each card stores itself.
+
+    Returns:
+        CardTemplate: The template.
+    """
+    return CardTemplate(card_class, *args, mutable=mutable)
+
+
+class TemplateDeck(Sequence):
+    """
+    A deck of copies of one template, built lazily.
+
+    Creating the deck allocates nothing per card: a copy is only built
+    the first time its position is accessed, then kept so that changes
+    to it persist.
+
+    Attributes:
+        template (CardTemplate): The template of every card.
+    """
+    __slots__ = ("template", "_size", "_cards")
+
+    def __init__(self, template: CardTemplate, size: int):
+        """
+        Initialize a new TemplateDeck instance.
+
+        Args:
+            template (CardTemplate): The template of every card.
+            size (int): The number of cards in the deck.
+        """
+        self.template = template
+        self._size = size
+        self._cards = {}
+
+    def __len__(self) -> int:
+        """
+        Get the number of cards in the deck.
+
+        Returns:
+            int: The size of the deck.
+        """
+        return self._size
+
+    def __getitem__(self, index):
+        """
+        Get the card at a position, building it on first access.
+
+        Args:
+            index (int | slice): The position(s) of the card(s).
+
+        Returns:
+            Card | list: The card, or a list of cards for a slice.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("TemplateDeck index out of range")
+        card = self._cards.get(index)
+        if card is None:
+            card = self._cards[index] = self.template.create()
+        return card
+
+    def __repr__(self) -> str:
+        """
+        Get a short description of the deck.
+
+        Returns:
+            str: The template card name and the deck size.
+        """
+        return f"TemplateDeck({self.template.args[0]!r} x {self._size})"
@@ -1,12 +1,55 @@
 from ex3 import CardFactory
+from ex3.CardTemplate import CardTemplate, TemplateDeck
 from ex0 import Card, CreatureCard
 from ex1 import ArtifactCard, SpellCard
 
+TEMPLATES = {
+    'dragon': (CreatureCard, "Fire Dragon", 5, "Rare", 5, 5),
+    'goblin': (CreatureCard, "Goblin Warrior", 2, "Common", 5, 2),
+    'fireball': (SpellCard, "Fireball", 4, "Uncommon", "Fire"),
+    'lightning': (SpellCard, "Lightning Bolt", 3, "Common", "Lightning"),
+    'mana_ring': (ArtifactCard, "Mana Ring", 3, "Uncommon", 5, "Mana")
+}
+
+MUTABLE_FIELDS = {
+    CreatureCard: ("health",),
+    ArtifactCard: ("durability",)
+}
+
 
 class FantasyCardFactory(CardFactory):
     """
     A concrete factory for creating fantasy themed cards.
+
+    Card data is interned once per factory as CardTemplate objects.
+    Created cards are flyweights: a creature only stores its health, an
+    artifact its durability and a spell nothing but its template.
     """
+    def __init__(self):
+        """
+        Initialize the factory with no template built yet.
+        """
+        self._templates = {}
+
+    def get_template(self, key: str) -> CardTemplate:
+        """
+        Get the interned template of a card, building it on first use.
+
+        Args:
+            key (str): The key of the card in TEMPLATES.
+
+        Returns:
+            CardTemplate: The shared template.
+        """
+        template = self._templates.get(key)
+        if template is None:
+            card_class, *args = TEMPLATES[key]
+            template = CardTemplate(
+                card_class, *args,
+                mutable=MUTABLE_FIELDS.get(card_class, ()))
+            self._templates[key] = template
+        return template
+
     def create_creature(self, name_or_power: str | int | None = None) -> Card:
         """
         Create a fantasy creature card.
@@ -19,8 +62,8 @@ class FantasyCardFactory(CardFactory):
         """
         if isinstance(name_or_power, str) and \
                      (name_or_power.lower() == 'dragon'):
-            return CreatureCard("Fire Dragon", 5, "Rare", 5, 5)
-        return CreatureCard("Goblin Warrior", 2, "Common", 5, 2)
+            return self.get_template('dragon').create()
+        return self.get_template('goblin').create()
 
     def create_spell(self, name_or_power: str | int | None = None) -> Card:
         """
@@ -34,8 +77,8 @@ class FantasyCardFactory(CardFactory):
         """
         if isinstance(name_or_power, str) and \
                      (name_or_power.lower() == 'fireball'):
-            return SpellCard("Fireball", 4, "Uncommon", "Fire")
-        return SpellCard("Lightning Bolt", 3, "Common", "Lightning")
+            return self.get_template('fireball').create()
+        return self.get_template('lightning').create()
 
     def create_artifact(self, name_or_power: str | int | None = None) -> Card:
         """
@@ -47,12 +90,15 @@ class FantasyCardFactory(CardFactory):
         Returns:
             Card: A new artifact card.
         """
-        return ArtifactCard("Mana Ring", 3, "Uncommon", 5, "Mana")
+        return self.get_template('mana_ring').create()
 
     def create_themed_deck(self, size: int) -> dict:
         """
         Create a fantasy themed deck.
 
+        The deck is a TemplateDeck of goblins, so its cards are only
+        built when accessed.
+
         Args:
             size (int): The size of the deck.
 
@@ -60,7 +106,7 @@ class FantasyCardFactory(CardFactory):
             dict: The created deck.
         """
         return {
-            'deck': [self.create_creature() for _ in range(size)]
+            'deck': TemplateDeck(self.get_template('goblin'), size)
         }
 
     def get_supported_types(self) -> dict:
@@ -1,6 +1,7 @@
 from ex3.GameStrategy import GameStrategy
 from ex3.AggressiveStrategy import AggressiveStrategy
 from ex3.CardFactory import CardFactory
+from ex3.CardTemplate import CardTemplate, TemplateDeck
 from ex3.FantasyCardFactory import FantasyCardFactory
 from ex3.GameEngine import GameEngine
 
@@ -8,6 +9,8 @@ __all__ = [
     "GameStrategy",
     "AggressiveStrategy",
     "CardFactory",
+    "CardTemplate",
+    "TemplateDeck",
     "FantasyCardFactory",
     "GameEngine"
 ]
@@ -5,6 +5,8 @@ class Rankable(ABC):
     """
     Abstract base class for rankable entities.
     """
+    __slots__ = ()
+
     @abstractmethod
     def calculate_rating(self) -> int:
         """
@@ -14,6 +14,8 @@ class TournamentCard(Card, Combatable, Rankable):
         wins (int): Number of wins.
         losses (int): Number of losses.
     """
+    __slots__ = ("attack_power", "defense_power", "rating", "wins", "losses")
+
     def __init__(self, name: str, cost: int, rarity: str, attack_power: int,
                  defense_power: int, rating: int = 1000):
         """